@@ -0,0 +1,74 @@
+"""Book aggregation: netting by underlying / expiry / strike bucket, full and incremental.
+
+On an n-position book over 500 underlyings, it times the full build,
+the grouping step alone (bincount vs a sort + np.add.reduceat reference),
+and incremental updates against a full refresh. The totals are checked
+against brute force in tests/test_aggregate.py. Run from the repository
+root:
+    python benchmarks/bench_aggregate.py [n_positions]
+"""
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks.aggregate import QUANTITIES, BookAggregation  # noqa: E402
+from tests import helpers  # noqa: E402
+
+
+def random_book(n, n_underlying=500, seed=0):
+    # Positions spread over n_underlying spots, strikes within 30% of their spot
+    rng = np.random.default_rng(seed)
+    underlying = rng.integers(0, n_underlying, n).astype(np.int32)
+    S = rng.uniform(20, 500, n_underlying)[underlying]
+    book = helpers.random_book(n, seed, S=S, K=S * rng.uniform(0.7, 1.3, n), T=(0.0, 3.0), r=0.03,
+                               quantity=rng.integers(-100, 101, n).astype(float), underlying=underlying)
+    book["underlying_labels"] = [f"U{i:03d}" for i in range(n_underlying)]
+    return book
+
+
+def main(n=5_000_000):
+    book = random_book(n)
+    build = min(timeit.repeat(lambda: BookAggregation(book), number=1, repeat=2))
+    agg = BookAggregation(book)
+    groups = agg.totals.shape[0]
+    print(f"{n:,} positions, 500 underlyings, {groups:,} (underlying, expiry, strike) groups")
+    print(f"  full build (price + bucket + group): {build:.2f} s ({n / build / 1e6:.2f} M positions/s)")
+
+    def by_bincount():
+        return [np.bincount(agg.codes, weights=row, minlength=groups) for row in agg.contributions]
+
+    def by_sort():
+        order = np.argsort(agg.codes, kind='stable')
+        sorted_codes = agg.codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        return np.add.reduceat(agg.contributions[:, order], starts, axis=1)
+
+    bincount_s = min(timeit.repeat(by_bincount, number=1, repeat=3))
+    sort_s = min(timeit.repeat(by_sort, number=1, repeat=3))
+    print(f"  grouping {len(QUANTITIES)} quantities: bincount {bincount_s * 1e3:.0f} ms, "
+          f"sort + reduceat {sort_s * 1e3:.0f} ms ({sort_s / bincount_s:.1f}x)")
+
+    refresh = min(timeit.repeat(agg.refresh, number=1, repeat=2))
+    print(f"  full refresh: {refresh * 1e3:.0f} ms")
+    rng = np.random.default_rng(2)
+    rows = agg.rows_of("U007")
+    cases = {
+        f"one underlying's spot ticks ({len(rows):,} rows)": (rows, "S"),
+        f"1% of the book decays one day ({n // 100:,} rows)": (np.sort(rng.choice(n, n // 100, replace=False)), "T"),
+    }
+    for label, (rows, column) in cases.items():
+        bump = 1.001 if column == "S" else None
+
+        def update():
+            values = agg.columns[column][rows]
+            agg.update(rows, **{column: values * bump if bump else np.maximum(values - 1 / 365, 0.0)})
+
+        seconds = min(timeit.repeat(update, number=1, repeat=5))
+        print(f"  update, {label}: {seconds * 1e3:.2f} ms ({refresh / seconds:.0f}x faster than a refresh)")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 5_000_000)
@@ -0,0 +1,47 @@
+"""American lattice pricer: throughput and accuracy against the European control.
+
+For several values of `tol`, it reports contracts/s, the average step count,
+the share of converged contracts and their largest error against a single
+3200-step lattice (on the first 100 contracts). The cost of the European
+closed form is shown as the control.
+The accuracy targets are in tests/test_american.py. Run from the repository
+root:
+    python benchmarks/bench_american.py [n_contracts]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import american_greeks, black_scholes_greeks_batch  # noqa: E402
+from tests.helpers import random_book  # noqa: E402
+
+TOLERANCES = (1e-2, 1e-3, 1e-4)
+
+
+def main(n=1_000, n_reference=100):
+    book = random_book(n, S=(60.0, 140.0), K=(60.0, 140.0), T=(0.05, 2.0), sigma=(0.1, 0.6))
+    # The fine lattice costs O(steps^2) per contract, so the error is measured on a subset only. One tree
+    # without extrapolation: Richardson amplifies the lattice's oscillation as much as it cancels its trend
+    sample = {key: value[:n_reference] for key, value in book.items()}
+    reference = american_greeks(**sample, tol=0.0, min_steps=3200, max_steps=3200).greeks.price
+
+    start = time.perf_counter()
+    black_scholes_greeks_batch(**book)
+    t = time.perf_counter() - start
+    print(f"{n:,} contracts\n{'European closed form':>22} {t * 1e3:>9.1f} ms {n / t:>12,.0f} contracts/s")
+    for tol in TOLERANCES:
+        start = time.perf_counter()
+        result = american_greeks(**book, tol=tol)
+        t = time.perf_counter() - start
+        converged = result.converged[:n_reference]
+        err = np.max(np.abs(result.greeks.price[:n_reference] - reference)[converged], initial=0.0)
+        print(f"{'American tol ' + format(tol, '.0e'):>22} {t * 1e3:>9.1f} ms {n / t:>12,.0f} contracts/s"
+              f"  mean steps {result.steps.mean():>6.0f}  converged {result.converged.mean():>4.0%}"
+              f"  max error {err:.1e}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000)
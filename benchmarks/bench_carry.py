@@ -0,0 +1,38 @@
+"""Cost of the continuous-carry generalization (Merton / Black-76 / Garman-Kohlhagen).
+
+Times the plain Black-Scholes kernel the batch pricer had before the carry
+parameter against the generalized one with q = 0 and with q > 0. Parity,
+finite-difference and bit-for-bit checks are in tests/test_carry.py. Run
+from the repository root:
+    python benchmarks/bench_carry.py [n_contracts]
+"""
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import black_scholes_greeks_batch  # noqa: E402
+from tests.helpers import plain_black_scholes_kernel, random_book  # noqa: E402
+
+
+def best_of(fn, repeat=7):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def main(n=1_000_000):
+    book = random_book(n, S=(60.0, 140.0), K=(60.0, 140.0))
+    q = np.full(n, 0.02)
+    print(f"{n:,} contracts")
+    for name, fn in (("reference (no q)", lambda: plain_black_scholes_kernel(**book)),
+                     ("generalized, q = 0", lambda: black_scholes_greeks_batch(**book)),
+                     ("generalized, q > 0", lambda: black_scholes_greeks_batch(**book, q=q))):
+        t = best_of(fn)
+        print(f"{name:>20} {t * 1e3:>8.1f} ms {n / t:>14,.0f} contracts/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,48 @@
+"""Rerun cost of the Interactive Tool curve: legacy per-point loop vs one vectorized call.
+
+Run from the repository root:
+    python benchmarks/bench_curve.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import black_scholes_greeks_batch  # noqa: E402
+from tests.helpers import legacy_black_scholes_greeks  # noqa: E402
+
+K, T, r, sigma, option_type = 105.0, 1.0, 0.05, 0.2, 'call'
+
+
+# The curve loop exactly as the app had it before vectorization
+def legacy_curve(n_points):
+    greek_values = []
+    for s_val in np.linspace(50, 150, n_points):
+        _, d, _, _, _, _ = legacy_black_scholes_greeks(s_val, K, T, r, sigma, option_type)
+        greek_values.append(d)
+    return greek_values
+
+
+def vectorized_curve(n_points):
+    S_range = np.linspace(50, 150, n_points)
+    return black_scholes_greeks_batch(S_range, K, T, r, sigma, option_type == 'call').delta
+
+
+def best_of(fn, n_points, repeat=5):
+    timer = timeit.Timer(lambda: fn(n_points))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def main():
+    print(f"{'points':>8} {'loop (ms)':>12} {'vectorized (ms)':>16} {'speed-up':>10}")
+    for n_points in (100, 1000, 2500, 5000, 10000):
+        t_loop = best_of(legacy_curve, n_points, repeat=3)
+        t_vec = best_of(vectorized_curve, n_points)
+        print(f"{n_points:>8} {t_loop * 1e3:>12.3f} {t_vec * 1e3:>16.3f} {t_loop / t_vec:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
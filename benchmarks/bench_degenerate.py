@@ -0,0 +1,26 @@
+"""Expiry-day and zero-vol books: evaluation time by share of degenerate rows.
+
+Times batches with 0%, 1%, 50% and 100% degenerate rows (T = 0 or
+sigma = 0). The limiting values themselves are checked in
+tests/test_degenerate.py. Run from the repository root:
+    python benchmarks/bench_degenerate.py [n_contracts]
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import black_scholes_greeks_batch  # noqa: E402
+from tests.helpers import expiry_day_book  # noqa: E402
+
+
+def main(n=1_000_000):
+    print(f"{n:,} contracts, seconds per batch")
+    for fraction in (0.0, 0.01, 0.5, 1.0):
+        book, _ = expiry_day_book(n, fraction)
+        seconds = min(timeit.repeat(lambda: black_scholes_greeks_batch(**book), number=1, repeat=5))
+        print(f"{fraction:>6.0%} degenerate {seconds * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,36 @@
+"""Higher-order Greeks: shared-pass timing.
+
+Times the extended pass (everything, and a subset) against the first-order
+batch pricer. The finite-difference validation is in
+tests/test_extended_greeks.py. Run from the repository root:
+    python benchmarks/bench_extended_greeks.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import black_scholes_greeks_batch, black_scholes_greeks_extended  # noqa: E402
+from tests.helpers import random_book  # noqa: E402
+
+
+def best_of(fn, repeat=5):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def main(n=1_000_000):
+    book = random_book(n, S=(60.0, 140.0), K=(60.0, 140.0), T=(0.1, 3.0))
+    cases = {
+        "first-order batch": lambda: black_scholes_greeks_batch(**book),
+        "extended, all 12": lambda: black_scholes_greeks_extended(**book),
+        "extended, vanna+volga": lambda: black_scholes_greeks_extended(**book, greeks=("vanna", "volga")),
+    }
+    print(f"{n:,} contracts")
+    for name, fn in cases.items():
+        print(f"{name:>24} {best_of(fn) * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Fused JIT kernel: speed-up and peak memory against the NumPy path.
+
+Times both paths and measures their peak traced memory (tracemalloc; NumPy
+reports its buffers to it) on books of 10k to 10M contracts. The parity
+suite is tests/test_fused.py. Run from the repository root:
+    python benchmarks/bench_fused.py [max_contracts]
+"""
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import black_scholes_greeks_batch  # noqa: E402
+from bsgreeks.fused import fused_greeks, jit_available  # noqa: E402
+from tests.helpers import random_book  # noqa: E402
+
+
+def peak_mb(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main(max_n=10_000_000):
+    if not jit_available():
+        sys.exit("numba is not installed (or BSGREEKS_JIT=0): fused_greeks is the NumPy path")
+    import numba
+    print(f"numba {numba.__version__}, {numba.get_num_threads()} threads")
+    print(f"{'contracts':>12} {'numpy ms':>10} {'fused ms':>10} {'speed-up':>9} {'numpy peak MB':>14} "
+          f"{'fused peak MB':>14} {'outputs MB':>11}")
+    n = 10_000
+    while n <= max_n:
+        book = random_book(n, T=(0.0, 3.0), sigma=(0.05, 1.0))
+        repeat = 5 if n <= 1_000_000 else 2
+        numpy_s = min(timeit.repeat(lambda: black_scholes_greeks_batch(**book), number=1, repeat=repeat))
+        fused_s = min(timeit.repeat(lambda: fused_greeks(**book), number=1, repeat=repeat))
+        numpy_mb = peak_mb(lambda: black_scholes_greeks_batch(**book))
+        fused_mb = peak_mb(lambda: fused_greeks(**book))
+        print(f"{n:>12,} {numpy_s * 1e3:>10.2f} {fused_s * 1e3:>10.2f} {numpy_s / fused_s:>8.2f}x "
+              f"{numpy_mb:>14.1f} {fused_mb:>14.1f} {6 * 8 * n / 2**20:>11.1f}")
+        n *= 10
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10_000_000)
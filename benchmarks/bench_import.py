@@ -0,0 +1,63 @@
+"""Import time and cold-start latency of the pricing code.
+
+Each scenario runs in a fresh interpreter. It reports the median import
+time, the time to the first price (import plus first call), and which heavy
+modules ended up loaded. "app script" is how black_scholes_greeks had to be
+obtained before the headless split: importing the Streamlit script, which
+executes the whole UI. Run from the repository root:
+    python benchmarks/bench_import.py [runs]
+"""
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY = ("streamlit", "matplotlib", "scipy.stats", "scipy.special")
+
+SCENARIOS = {
+    "app script": (
+        "import logging; logging.disable(logging.WARNING)\n"
+        "import blackscholes_with_greeks_EN as mod",
+        "mod.black_scholes_greeks(100.0, 105.0, 1.0, 0.05, 0.2)",
+    ),
+    "bsgreeks scalar": (
+        "import bsgreeks as mod",
+        "mod.black_scholes_greeks(100.0, 105.0, 1.0, 0.05, 0.2)",
+    ),
+    "bsgreeks array": (
+        "import bsgreeks as mod",
+        "mod.black_scholes_greeks_batch(100.0, [95.0, 105.0], 1.0, 0.05, 0.2)",
+    ),
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{imports}
+imported = time.perf_counter()
+{call}
+priced = time.perf_counter()
+print(json.dumps({{"import": imported - start, "cold_start": priced - start,
+                  "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def probe(imports, call):
+    code = PROBE.format(imports=imports, call=call, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(runs=5):
+    print(f"{'scenario':>16} {'import (ms)':>12} {'cold start (ms)':>16}  heavy modules loaded")
+    for name, (imports, call) in SCENARIOS.items():
+        samples = [probe(imports, call) for _ in range(runs)]
+        import_ms = statistics.median(s["import"] for s in samples) * 1e3
+        cold_ms = statistics.median(s["cold_start"] for s in samples) * 1e3
+        print(f"{name:>16} {import_ms:>12.1f} {cold_ms:>16.1f}  {', '.join(samples[0]['loaded']) or '-'}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,48 @@
+"""Incremental revaluation: which intermediates a slider move recomputes, and what that saves.
+
+It times a full batch revaluation, and an incremental pricer with an empty
+cache, against an incremental update of each single input on a book of n
+contracts. It repeats this for the Interactive Tool curve (10,000 spot
+points, scalar K, T, r and sigma). Parity with the batch pricer is checked
+in tests/test_incremental.py. Run from the repository root:
+    python benchmarks/bench_incremental.py [n_contracts]
+"""
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import black_scholes_greeks_batch  # noqa: E402
+from bsgreeks.incremental import IncrementalPricer  # noqa: E402
+from tests import helpers  # noqa: E402
+
+
+def random_book(n):
+    book = helpers.random_book(n, T=(0.0, 2.0), r=0.03, q=0.01)
+    book["T"][: n // 100] = 0.0
+    return book
+
+
+def main(n=1_000_000):
+    book = random_book(n)
+    S_grid = np.linspace(50.0, 150.0, 10_000)
+    curve = dict(S=S_grid, K=105.0, T=1.0, r=0.05, sigma=0.2, is_call=True, q=0.0)
+    for label, inputs in ((f"{n:,}-contract book", book), ("10,000-point curve", curve)):
+        pricer = IncrementalPricer(**inputs)
+        pricer.greeks()
+        full = min(timeit.repeat(lambda: black_scholes_greeks_batch(**inputs), number=1, repeat=5))
+        cold = min(timeit.repeat(lambda: IncrementalPricer(**inputs).greeks(), number=1, repeat=5))
+        print(f"\n{label}: full batch {full * 1e3:.2f} ms, incremental with nothing cached {cold * 1e3:.2f} ms")
+        for name in ("S", "sigma", "r", "T", "is_call"):
+            # Alternate between two values so every repeat really changes the input
+            values = [np.logical_not(inputs[name]) if name == "is_call" else inputs[name] * 1.01, inputs[name]]
+            state = iter(values * 10)
+            seconds = min(timeit.repeat(lambda: pricer.update(**{name: next(state)}).greeks(), number=1, repeat=5))
+            print(f"  {name:>8} moves: {seconds * 1e3:>8.2f} ms ({full / seconds:.2f}x), "
+                  f"{len(pricer.recomputed)} nodes recomputed")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,40 @@
+"""Overhead of the profiling hooks, disabled and enabled.
+
+It times a bare `with stage(...)` and `count(...)`, and the cache-hit
+path of `cached_greeks` (the hottest instrumented call), in both states.
+The registry and its export formats are tested in tests/test_metrics.py.
+Run from the repository root:
+    python benchmarks/bench_metrics.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import cached_greeks, metrics  # noqa: E402
+
+
+def main():
+    cached_greeks(100.0, 105.0, 1.0, 0.05, 0.2, 'call')  # warm the cache
+
+    def bare_stage():
+        with metrics.stage("bench"):
+            pass
+
+    cases = {
+        "with stage(...)": bare_stage,
+        "count(...)": lambda: metrics.count("bench"),
+        "cached_greeks (hit)": lambda: cached_greeks(100.0, 105.0, 1.0, 0.05, 0.2, 'call'),
+    }
+    print(f"{'hook':>22} {'disabled ns':>12} {'enabled ns':>12}")
+    for name, fn in cases.items():
+        timings = []
+        for on in (False, True):
+            metrics.enable(on)
+            timings.append(min(timeit.repeat(fn, number=100_000, repeat=5)) / 100_000 * 1e9)
+        print(f"{name:>22} {timings[0]:>12.0f} {timings[1]:>12.0f}")
+    metrics.enable(False)
+
+
+if __name__ == "__main__":
+    main()
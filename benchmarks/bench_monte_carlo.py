@@ -0,0 +1,38 @@
+"""Monte Carlo pricer: variance-reduction speed-ups.
+
+It reports price, standard error, paths/s and the speed-up over plain
+Monte Carlo for each combination of antithetic and control variates on the
+Asian call. The cross-checks against the closed form are in
+tests/test_monte_carlo.py. Run from the repository root:
+    python benchmarks/bench_monte_carlo.py [n_paths]
+"""
+import sys
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import monte_carlo_price  # noqa: E402
+
+CONTRACT = dict(S=100.0, K=105.0, T=1.0, r=0.05, sigma=0.2)
+
+
+def asian_call(paths, K):
+    return np.maximum(paths.mean(axis=1) - K, 0.0)
+
+
+def main(n_paths=10_000_000):
+    asian = partial(asian_call, K=CONTRACT["K"])
+    print(f"Asian call, 12 monitoring dates, {n_paths:,} paths")
+    print(f"{'variant':>22} {'price':>9} {'std error':>10} {'paths/s':>14} {'speed-up':>9}")
+    for antithetic, control in ((False, False), (True, False), (False, True), (True, True)):
+        mc = monte_carlo_price(**CONTRACT, n_paths=n_paths, n_steps=12, payoff=asian,
+                               antithetic=antithetic, control_variate=control)
+        label = " + ".join(name for name, on in (("antithetic", antithetic), ("control", control)) if on)
+        print(f"{label or 'plain':>22} {mc.price:>9.5f} {mc.std_error:>10.2e} {mc.paths_per_second:>14,.0f}"
+              f" {mc.speedup:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10_000_000)
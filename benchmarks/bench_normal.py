@@ -0,0 +1,38 @@
+"""Speed of the bsgreeks normal kernel against scipy.stats.norm.
+
+Accuracy is covered by tests/test_normal.py. Run from the repository root:
+    python benchmarks/bench_normal.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+from scipy.stats import norm
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import norm_cdf, norm_pdf  # noqa: E402
+
+def best_of(fn, repeat=5):
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def main():
+    scalar = 0.3253
+    array = np.random.default_rng(1).standard_normal(1_000_000)
+    cases = [
+        ("cdf scalar", lambda: norm.cdf(scalar), lambda: norm_cdf(scalar), 1e6, "us"),
+        ("pdf scalar", lambda: norm.pdf(scalar), lambda: norm_pdf(scalar), 1e6, "us"),
+        ("cdf 1e6", lambda: norm.cdf(array), lambda: norm_cdf(array), 1e3, "ms"),
+        ("pdf 1e6", lambda: norm.pdf(array), lambda: norm_pdf(array), 1e3, "ms"),
+    ]
+    print(f"{'case':>12} {'scipy.stats':>14} {'bsgreeks':>12} {'speed-up':>10}")
+    for name, slow, fast, scale, unit in cases:
+        t_slow, t_fast = best_of(slow), best_of(fast)
+        print(f"{name:>12} {t_slow * scale:>11.2f} {unit} {t_fast * scale:>9.2f} {unit} {t_slow / t_fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
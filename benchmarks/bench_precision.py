@@ -0,0 +1,65 @@
+"""Float32 against float64 in the batch pricer: error, throughput and memory.
+
+It reports the error per Greek against float64, relative to a natural
+scale (S for price, theta, vega and rho, 1 for delta, gamma itself for
+gamma). Then, for each precision, it reports time, contracts/s and peak
+memory traced while pricing. The tolerance is asserted in
+tests/test_precision.py. Run from the repository root:
+    python benchmarks/bench_precision.py [n_contracts]
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import black_scholes_greeks_batch  # noqa: E402
+from tests.helpers import random_book  # noqa: E402
+
+# Gammas far out of the money underflow in float32; below this they are compared absolutely
+GAMMA_FLOOR = 1e-8
+
+
+def realistic_book(n):
+    return tuple(random_book(n, T=(0.02, 3.0), sigma=(0.05, 1.0)).values())
+
+
+def report_error(n=1_000_000):
+    book = realistic_book(n)
+    S = book[0]
+    single = black_scholes_greeks_batch(*book, dtype=np.float32)
+    double = black_scholes_greeks_batch(*book)
+    scales = dict(price=S, delta=1.0, gamma=np.maximum(np.abs(double.gamma), GAMMA_FLOOR), theta=S, vega=S, rho=S)
+    print(f"float32 error vs float64 on {n:,} contracts (max scaled / max absolute)")
+    for name in double._fields:
+        error = np.abs(getattr(single, name) - getattr(double, name))
+        scaled = np.max(error / scales[name])
+        print(f"{name:>6} scaled {scaled:.1e}   absolute {error.max():.1e}")
+
+
+def profile(book, dtype):
+    book = tuple(np.asarray(a, dtype=dtype if a.dtype != bool else bool) for a in book)
+    black_scholes_greeks_batch(*book, dtype=dtype)  # warm-up
+    tracemalloc.start()
+    start = time.perf_counter()
+    black_scholes_greeks_batch(*book, dtype=dtype)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(n=10_000_000):
+    report_error()
+    book = realistic_book(n)
+    print(f"\n{n:,} contracts")
+    for dtype in (np.float64, np.float32):
+        elapsed, peak = profile(book, dtype)
+        print(f"{np.dtype(dtype).name:>8} {elapsed * 1e3:>9.1f} ms {n / elapsed:>14,.0f} contracts/s"
+              f"  peak {peak / 2**20:>7.0f} MiB")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,90 @@
+"""Per-rerun chart render time and resident memory after many reruns.
+
+Compares three chart paths:
+- legacy: a new pyplot figure on every rerun, encoded to PNG the way
+  st.pyplot does it, and never closed.
+- reused: the shared bsgreeks.render figure with the byte cache cleared,
+  so every rerun really draws.
+- cached: bsgreeks.render.greek_chart cycling through the same 20 views,
+  so the byte cache answers after the first pass.
+
+Each path runs in a fresh process so the RSS figures do not mix. Run from
+the repository root:
+    python benchmarks/bench_render.py [n_reruns]
+"""
+import io
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _rss_mib():
+    with open("/proc/self/statm") as fh:
+        return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def _views(n_reruns):
+    # Slider drags: spot moves between reruns, everything else fixed
+    return [(100.0 + (i % 20), 105.0, 1.0, 0.05, 0.2) for i in range(n_reruns)]
+
+
+def run_mode(mode, n_reruns, queue):
+    sys.path.insert(0, str(ROOT))
+    import matplotlib
+    matplotlib.use("Agg")
+    matplotlib.rcParams["figure.max_open_warning"] = 0  # the legacy leak is what is being measured
+    import matplotlib.pyplot as plt
+    from bsgreeks import black_scholes_greeks_batch
+    from bsgreeks.render import _chart, greek_chart
+    import numpy as np
+
+    def legacy(S, K, T, r, sigma):
+        fig, ax = plt.subplots(figsize=(10, 5))
+        S_range = np.linspace(50, 150, 1000)
+        ax.plot(S_range, black_scholes_greeks_batch(S_range, K, T, r, sigma, True).delta,
+                color='darkorange', linewidth=2)
+        ax.axvline(S, color='red', linestyle='--', label='Current Stock Price (S)')
+        ax.set_title("Delta vs Stock Price", fontweight='bold')
+        ax.set_xlabel("Stock Price (S)")
+        ax.set_ylabel("Delta")
+        ax.grid(alpha=0.3)
+        ax.legend()
+        fig.savefig(io.BytesIO(), format='png')
+
+    def reused(S, K, T, r, sigma):
+        _chart.cache_clear()
+        greek_chart("Delta", S, K, T, r, sigma)
+
+    def cached(S, K, T, r, sigma):
+        greek_chart("Delta", S, K, T, r, sigma)
+
+    render = {"legacy": legacy, "reused": reused, "cached": cached}[mode]
+    rss_start = _rss_mib()
+    times = []
+    for view in _views(n_reruns):
+        start = time.perf_counter()
+        render(*view)
+        times.append(time.perf_counter() - start)
+    queue.put((sorted(times), rss_start, _rss_mib()))
+
+
+def main(n_reruns=1000):
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{n_reruns} reruns")
+    print(f"{'mode':>8} {'p50 (ms)':>10} {'p99 (ms)':>10} {'RSS start':>10} {'RSS end':>10} (MiB)")
+    for mode in ("legacy", "reused", "cached"):
+        queue = ctx.Queue()
+        proc = ctx.Process(target=run_mode, args=(mode, n_reruns, queue))
+        proc.start()
+        times, rss_start, rss_end = queue.get()
+        proc.join()
+        p50, p99 = times[len(times) // 2], times[int(len(times) * 0.99)]
+        print(f"{mode:>8} {p50 * 1e3:>10.2f} {p99 * 1e3:>10.2f} {rss_start:>10.1f} {rss_end:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
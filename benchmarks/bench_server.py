@@ -0,0 +1,91 @@
+"""Load test: N concurrent sessions dragging sliders, without and with shared workers.
+
+Every simulated session is a thread and runs the compute part of an
+Interactive Tool rerun: `cached_greeks`, the Greek chart image and an S-T
+heatmap surface. It does so for a drag of one slider, one step per rerun,
+starting from the defaults or one of the lab presets, so sessions overlap
+the way a class working through the same lab does. The load test reports
+rerun latency percentiles and throughput in single-process mode (the
+current behaviour) and with a `WorkerPool`. The pool itself is tested in
+tests/test_workers.py. Run from the repository root:
+    python benchmarks/bench_server.py [--sessions 32] [--reruns 20] [--workers 4]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import cached_greeks, clear_caches, workers  # noqa: E402
+from bsgreeks.render import _chart, _surface_image, greek_chart, surface_image  # noqa: E402
+
+# Reset defaults and the Practical Labs presets: (S, K, T, r, sigma, option type)
+PRESETS = [(100.0, 105.0, 1.0, 0.05, 0.2, 'call'), (100.0, 100.0, 0.08, 0.02, 0.4, 'call'),
+           (100.0, 100.0, 0.5, 0.05, 0.25, 'put'), (100.0, 90.0, 2.0, 0.04, 0.3, 'call')]
+# Slider index in the preset tuple -> step of one drag event
+STEPS = {0: 1.0, 1: 1.0, 2: 0.1, 4: 0.01}
+
+
+def rerun(S, K, T, r, sigma, option_type, greek):
+    cached_greeks(S, K, T, r, sigma, option_type)
+    workers.compute(greek_chart, greek, S, K, T, r, sigma, option_type, 1000)
+    workers.compute(surface_image, "S-T", greek, "Heatmap", 60, S, K, T, r, sigma, option_type)
+
+
+def session(seed, reruns, barrier, latencies):
+    rng = np.random.default_rng(seed)
+    inputs = list(PRESETS[rng.integers(len(PRESETS))])
+    slider = list(STEPS)[rng.integers(len(STEPS))]
+    greek = ("Delta", "Gamma")[rng.integers(2)]
+    barrier.wait()
+    for _ in range(reruns):
+        inputs[slider] = round(inputs[slider] + STEPS[slider], 6)
+        start = time.perf_counter()
+        rerun(*inputs, greek)
+        latencies.append(time.perf_counter() - start)
+
+
+def load_test(n_sessions, reruns):
+    clear_caches()
+    _chart.cache_clear()
+    _surface_image.cache_clear()
+    latencies = []
+    barrier = threading.Barrier(n_sessions)
+    threads = [threading.Thread(target=session, args=(seed, reruns, barrier, latencies)) for seed in range(n_sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1e3
+    return p50, p90, p99, len(latencies) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count()))
+    args = parser.parse_args()
+
+    print(f"{args.sessions} sessions x {args.reruns} slider steps (chart + 60x60 heatmap per rerun)")
+    print(f"{'mode':>22} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'reruns/s':>9}")
+    p50, p90, p99, rate = load_test(args.sessions, args.reruns)
+    print(f"{'single process':>22} {p50:>9.1f} {p90:>9.1f} {p99:>9.1f} {rate:>9.1f}")
+
+    workers.start(args.workers)
+    p50, p90, p99, rate = load_test(args.sessions, args.reruns)
+    print(f"{f'{args.workers} workers':>22} {p50:>9.1f} {p90:>9.1f} {p99:>9.1f} {rate:>9.1f}")
+    stats = workers.stats()
+    print(f"  {stats['requests']} requests: {stats['submitted']} computed, "
+          f"{stats['coalesced']} merged in flight, {stats['cached']} cached")
+    workers.stop()
+
+
+if __name__ == "__main__":
+    main()
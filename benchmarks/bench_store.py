@@ -0,0 +1,80 @@
+"""Columnar position store: size and open/load cost against CSV.
+
+It writes an n-row store and reports its size against CSV. It times
+opening the store (memory-mapped, copies nothing) against parsing the same
+book from CSV, and single-process pricing throughput from the store against
+in-memory arrays. Round trips and chunking are tested in
+tests/test_store.py. Run from the repository root:
+    python benchmarks/bench_store.py [n_rows]
+"""
+import os
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks.portfolio import price_chunk, price_store_chunk, read_positions  # noqa: E402
+from bsgreeks.store import PositionStore, store_to_csv, write_store  # noqa: E402
+from tests.helpers import random_book  # noqa: E402
+
+
+def random_positions(n):
+    return random_book(n, T=(0.0, 3.0), r=0.03, quantity=np.arange(n) % 201 - 100.0)
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def main(n=10_000_000, chunk_size=250_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sample = 1_000_000
+        positions = random_positions(sample)
+        store_to_csv(write_store(tmp / "sample.positions", positions), tmp / "sample.csv")
+        start = time.perf_counter()
+        read_positions(tmp / "sample.csv")  # the fast parser, as `python -m bsgreeks.portfolio` uses
+        csv_seconds = (time.perf_counter() - start) * n / sample
+        csv_mb = (tmp / "sample.csv").stat().st_size * n / sample / 2**20
+
+        positions = random_positions(n)
+        start = time.perf_counter()
+        write_store(tmp / "book.positions", positions)
+        write_seconds = time.perf_counter() - start
+        store_mb = sum(f.stat().st_size for f in (tmp / "book.positions").iterdir()) / 2**20
+
+        before = rss_mb()
+        start = time.perf_counter()
+        store = PositionStore.open(tmp / "book.positions")
+        open_seconds = time.perf_counter() - start
+        grown = rss_mb() - before
+
+        print(f"{n:,} positions: store {store_mb:,.0f} MB (written in {write_seconds:.2f} s), "
+              f"CSV ~{csv_mb:,.0f} MB")
+        print(f"  open store: {open_seconds * 1e3:.2f} ms, RSS +{grown:.1f} MB")
+        print(f"  parse CSV:  ~{csv_seconds:.1f} s (extrapolated from {sample:,} rows)")
+
+        bounds = list(store.chunks(chunk_size))
+
+        def from_store():
+            for lo, hi in bounds:
+                price_store_chunk(store, lo, hi)
+
+        def in_memory():
+            for lo, hi in bounds:
+                price_chunk(*(positions[name][lo:hi] for name in ("S", "K", "T", "r", "sigma", "is_call", "quantity")))
+
+        first = timeit.timeit(from_store, number=1)  # includes faulting the mapped pages in
+        store_seconds = min(timeit.repeat(from_store, number=1, repeat=3))
+        memory_seconds = min(timeit.repeat(in_memory, number=1, repeat=3))
+        print(f"  price every chunk, one process: from store {n / store_seconds / 1e6:.2f} M/s "
+              f"(first pass {n / first / 1e6:.2f} M/s), in memory {n / memory_seconds / 1e6:.2f} M/s")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10_000_000)
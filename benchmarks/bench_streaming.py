@@ -0,0 +1,77 @@
+"""Per-tick latency of the streaming pipeline versus full batch revaluation.
+
+Parity with the batch pricer, degenerate rows and source failures are
+covered by tests/test_streaming.py. Run from the repository root:
+    python benchmarks/bench_streaming.py [n_contracts] [n_ticks]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import black_scholes_greeks_batch  # noqa: E402
+from bsgreeks.metrics import LatencyHistogram  # noqa: E402
+from bsgreeks.streaming import PrecomputedBook, stream_greeks, tick_greeks  # noqa: E402
+from tests import helpers  # noqa: E402
+
+
+def random_book(n):
+    # One underlying: S is the tick, not a column of the book
+    book = helpers.random_book(n, r=0.03, quantity=np.arange(n) % 100 - 50.0)
+    del book["S"]
+    return book
+
+
+def random_walk(n_ticks, seed=1):
+    return 100.0 * np.exp(np.cumsum(np.random.default_rng(seed).normal(0, 1e-3, n_ticks)))
+
+
+async def paced(spots, interval):
+    # Wall-clock feed: ticks that fell due while the pricer was busy arrive in a burst
+    start = time.perf_counter()
+    for i, S in enumerate(spots):
+        delay = start + i * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        yield S
+
+
+def main(n_contracts=100_000, n_ticks=1_000):
+    book = random_book(n_contracts)
+    spots = random_walk(n_ticks)
+
+    full = LatencyHistogram()
+    for S in spots:
+        start = time.perf_counter()
+        greeks = black_scholes_greeks_batch(S, book["K"], book["T"], book["r"], book["sigma"], book["is_call"])
+        [book["quantity"] @ values for values in greeks]
+        full.record(time.perf_counter() - start)
+
+    precomputed = PrecomputedBook(**book)
+    incremental = LatencyHistogram()
+    for _ in tick_greeks(precomputed, spots, incremental):
+        pass
+
+    print(f"book: {n_contracts:,} contracts, {n_ticks:,} ticks")
+    print(f"{'':>22} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    for name, hist in (("full batch reprice", full), ("precomputed book", incremental)):
+        print(f"{name:>22} {hist.percentile(50) * 1e3:>10.3f} {hist.percentile(99) * 1e3:>10.3f}")
+
+    # Async pipeline with a source faster than the pricer: conflation keeps the queue at one tick
+    async def run():
+        stats, hist, produced = {}, LatencyHistogram(), 0
+        async for _ in stream_greeks(precomputed, paced(spots, 1e-4), histogram=hist, stats=stats):
+            produced += 1
+        return produced, stats["dropped"], hist
+
+    produced, dropped, hist = asyncio.run(run())
+    print(f"async (1e-4 s tick spacing): {produced} revaluations, {dropped} stale ticks conflated, "
+          f"p50 {hist.percentile(50) * 1e3:.3f} ms, p99 {hist.percentile(99) * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
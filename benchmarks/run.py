@@ -0,0 +1,148 @@
+"""Benchmark suite for the pricing core with regression tracking.
+
+Times each case and writes machine-readable JSON. Optionally it compares
+the run against a saved baseline and exits non-zero when a case has slowed
+down by more than the threshold. Run from the repository root:
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --compare results.json --threshold 0.15
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from bsgreeks import black_scholes_greeks_batch, cached_greek_curves, clear_caches, implied_volatility  # noqa: E402
+from tests import helpers  # noqa: E402
+
+
+def random_book(n):
+    return tuple(helpers.random_book(n, S=100.0, r=0.03).values())
+
+
+def case_scalar():
+    return lambda: black_scholes_greeks_batch(100.0, 105.0, 1.0, 0.05, 0.2, True), 1
+
+
+def case_batch(n):
+    def setup():
+        book = random_book(n)
+        return lambda: black_scholes_greeks_batch(*book), n
+    return setup
+
+
+def case_curve():
+    # Cold tab1 rerun: the cache is cleared so the curve is really computed
+    def run():
+        clear_caches()
+        cached_greek_curves(50.0, 150.0, 1000, 105.0, 1.0, 0.05, 0.2, 'call')
+    return run, 1000
+
+
+def case_implied_vol(n=10_000):
+    S, K, T, r, sigma, is_call = random_book(n)
+    price = black_scholes_greeks_batch(S, K, T, r, sigma, is_call).price
+    return lambda: implied_volatility(price, S, K, T, r, is_call), n
+
+
+CASES = {
+    "scalar": case_scalar,
+    "batch_100": case_batch(100),
+    "batch_1e6": case_batch(1_000_000),
+    "batch_1e7": case_batch(10_000_000),
+    "tab1_curve_1000": case_curve,
+    "implied_vol_1e4": case_implied_vol,
+}
+QUICK_SKIP = {"batch_1e7"}
+
+
+def measure(fn, min_time=0.2, repeat=5):
+    """Median and best per-call time, calibrating the inner loop to about `min_time`."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return float(np.median(samples)), float(min(samples))
+
+
+def run_suite(names, repeat=5):
+    results = {}
+    for name in names:
+        fn, n_items = CASES[name]()
+        fn()  # warm-up
+        median, best = measure(fn, repeat=repeat)
+        results[name] = {"median_s": median, "min_s": best, "items": n_items, "items_per_s": n_items / median}
+        print(f"{name:>18} {median * 1e3:>12.4f} ms {n_items / median:>16,.0f} items/s")
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Print the change per case against `baseline`; return the names that regressed."""
+    regressions = []
+    print(f"\n{'case':>18} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before, after = baseline["results"][name]["median_s"], result["median_s"]
+        change = after / before - 1.0
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:>18} {before * 1e3:>12.4f} {after * 1e3:>12.4f} {change:>+7.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slow-down of the median time that counts as a regression (default 0.10)")
+    parser.add_argument("--quick", action="store_true", help="skip the 1e7-element case")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("cases", nargs="*", help="subset of cases to run: " + ", ".join(CASES))
+    args = parser.parse_args(argv)
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+
+    names = args.cases or [name for name in CASES if not (args.quick and name in QUICK_SKIP)]
+    current = run_suite(names, repeat=args.repeat)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2))
+    if args.compare:
+        regressions = compare(current, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
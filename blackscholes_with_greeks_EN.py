@@ -1,7 +1,25 @@
+import json
+import os
+import time
+
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.stats import norm
+# All pricing lives in the headless bsgreeks package; this script is only the UI.
+# black_scholes_greeks is still importable from here for older notebooks and scripts.
+from bsgreeks import ResolutionController, black_scholes_greeks, cache_stats, cached_greeks, stress_cube  # noqa: F401
+from bsgreeks import metrics, workers
+from bsgreeks.render import (
+    chart_cache_info, greek_chart, greek_chart_data, heatmap, surface_cache_info, surface_image,
+)
+
+rerun_start = time.perf_counter()
+# Stage timings can also be scraped: BSGREEKS_PROFILE=1 BSGREEKS_METRICS_PORT=9108 streamlit run ...
+if os.environ.get("BSGREEKS_METRICS_PORT"):
+    metrics.serve(int(os.environ["BSGREEKS_METRICS_PORT"]))
+# Many concurrent users: render charts in a process pool shared by every session, e.g.
+# BSGREEKS_WORKERS=8 streamlit run ...; identical requests in flight are computed once
+if os.environ.get("BSGREEKS_WORKERS"):
+    workers.start(int(os.environ["BSGREEKS_WORKERS"]))
 
 #######################################
 # 1) Define two callback functions:
@@ -25,28 +43,36 @@ def set_lab1_parameters():
     st.session_state["option_type_radio"] = 'call'
 #######################################
 
-# Black-Scholes function with Greeks calculation
-def black_scholes_greeks(S, K, T, r, sigma, option_type='call'):
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-    
-    if option_type == 'call':
-        price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
-        delta = norm.cdf(d1)
-        rho = K * T * np.exp(-r * T) * norm.cdf(d2)
-    else:
-        price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
-        delta = norm.cdf(d1) - 1
-        rho = -K * T * np.exp(-r * T) * norm.cdf(-d2)
-    
-    gamma = norm.pdf(d1) / (S * sigma * np.sqrt(T))
-    vega = S * norm.pdf(d1) * np.sqrt(T)
-    theta = (
-        - (S * norm.pdf(d1) * sigma) / (2 * np.sqrt(T))
-        - r * K * np.exp(-r * T) * norm.cdf(d2 if option_type == 'call' else -d2)
-    )
-    
-    return price, delta, gamma, theta, vega, rho
+# Seconds between fragment reruns while a Greek surface is still being refined
+SURFACE_REFINE_EVERY = 0.1
+
+def greek_surface_view(controller, state, request):
+    """Draw the surface at grid size state["n"]; on a fragment rerun, first move to the next finer grid.
+
+    The full script run only draws the grid it already chose, so the rest of
+    the page never waits for refinement. While finer grids remain, the
+    caller runs this as a fragment on a timer. Each refinement step is then
+    its own short fragment rerun, and any widget change cancels it.
+    """
+    refining = state["advance"] and bool(state["pending"])
+    if refining:
+        state["n"] = state["pending"].pop(0)
+    state["advance"] = True
+    n = state["n"]
+
+    start, misses = time.perf_counter(), surface_cache_info()["misses"]
+    args = (*request[:3], n, *request[3:])
+    future = workers.submit(surface_image, *args)
+    # Cache hits say nothing about render cost; with workers, a hit is a future that is already done
+    rendered = not future.done() or surface_cache_info()["misses"] > misses
+    image = workers.result(future, surface_image, *args)
+    if rendered:
+        controller.observe(n, time.perf_counter() - start)
+    with metrics.stage("streamlit.image"):
+        st.image(image, caption=f"{n} × {n} grid")
+    if refining and not state["pending"]:
+        # Finest grid drawn: a full rerun re-registers the fragment without its timer
+        st.rerun()
 
 # Configure the Streamlit app
 st.set_page_config(layout="wide")
@@ -68,6 +94,19 @@ with st.sidebar:
     r = st.slider("Risk-Free Interest Rate (r)", 0.0, 0.2, 0.05, key='r_slider')
     sigma = st.slider("Volatility (σ)", 0.1, 1.0, 0.2, key='sigma_slider')
     option_type = st.radio("Option Type", ["call", "put"], key='option_type_radio')
+    curve_points = st.select_slider(
+        "Chart Resolution (points)", [100, 1000, 2500, 5000, 10000], value=1000, key='curve_points_slider'
+    )
+
+    # Filled in after the Interactive Tool has run, so the counts include this rerun
+    cache_stats_panel = st.expander("🗄️ Cache Statistics")
+    # Timings are filled in at the end of the script; the switch must act before anything runs
+    profiling_panel = st.expander("⏱️ Profiling")
+    with profiling_panel:
+        metrics.enable(st.checkbox(
+            "Time each stage", value=metrics.is_enabled(), key='profiling_checkbox',
+            help="Process-wide: timings from every session on this server are collected together.",
+        ))
 
     # Disclaimer and license
     st.markdown("---")
@@ -107,8 +146,8 @@ tab1, tab2, tab3, tab4, tab5 = st.tabs([
 ])
 
 with tab1:
-    # Calculate option price and Greeks
-    price, delta, gamma, theta, vega, rho = black_scholes_greeks(S, K, T, r, sigma, option_type)
+    # Calculate option price and Greeks (memoized across reruns and sessions)
+    price, delta, gamma, theta, vega, rho = cached_greeks(S, K, T, r, sigma, option_type)
 
     # Display results in columns
     col1, col2 = st.columns([1, 3])
@@ -138,33 +177,19 @@ with tab1:
             index=0
         )
         
-        # Generate graph for the selected Greek
-        fig, ax = plt.subplots(figsize=(10, 5))
-        S_range = np.linspace(50, 150, 100)
-        
-        # Calculate values for the selected Greek across the stock price range
-        greek_values = []
-        for s_val in S_range:
-            _, d, g, t_, v_, r_val_ = black_scholes_greeks(s_val, K, T, r, sigma, option_type)
-            if selected_greek == "Delta":
-                greek_values.append(d)
-            elif selected_greek == "Gamma":
-                greek_values.append(g)
-            elif selected_greek == "Theta":
-                greek_values.append(t_ / 365)  # Daily Theta
-            elif selected_greek == "Vega":
-                greek_values.append(v_)
-            else:  # Rho
-                greek_values.append(r_val_)
-        
-        ax.plot(S_range, greek_values, color='darkorange', linewidth=2)
-        ax.axvline(S, color='red', linestyle='--', label='Current Stock Price (S)')
-        ax.set_title(f"{selected_greek} vs Stock Price", fontweight='bold')
-        ax.set_xlabel("Stock Price (S)")
-        ax.set_ylabel(f"{selected_greek}")
-        ax.grid(alpha=0.3)
-        ax.legend()
-        st.pyplot(fig)
+        # Image mode re-uses one server-side figure and caches the encoded PNG;
+        # interactive mode ships only the curve arrays and lets the browser draw them
+        chart_mode = st.radio(
+            "Chart rendering", ["Image", "Interactive"], horizontal=True, key='chart_mode_radio'
+        )
+        if chart_mode == "Image":
+            chart = workers.compute(greek_chart, selected_greek, S, K, T, r, sigma, option_type, curve_points)
+            with metrics.stage("streamlit.image"):
+                st.image(chart)
+        else:
+            chart_data = greek_chart_data(selected_greek, K, T, r, sigma, option_type, curve_points)
+            with metrics.stage("streamlit.line_chart"):
+                st.line_chart(chart_data, x="Stock Price (S)", y=selected_greek)
 
         # Dynamic explanation for the selected Greek
         explanations = {
@@ -201,6 +226,91 @@ with tab1:
         }
         st.info(f"📘 **{selected_greek} Deep Dive**\n{explanations[selected_greek]}")
 
+    # Stress test: the current contract under every combination of shocks. Expanders only hide
+    # their content, so the cube and its image are computed only once the user turns them on
+    with st.expander("🌪️ Stress Test Heatmap"):
+        stress_col1, stress_col2 = st.columns([1, 3])
+        with stress_col1:
+            stress_enabled = st.toggle("Compute heatmap", key='stress_enabled')
+            spot_range = st.slider("Spot shock range (±%)", 5, 50, 20, key='stress_spot') / 100
+            vol_range = st.slider("Volatility shock range (± vol points)", 1, 30, 10, key='stress_vol') / 100
+            rate_range = st.slider("Rate shift range (± bp)", 0, 300, 100, step=25, key='stress_rate') / 10000
+            decay_days = st.slider("Time decay (days)", 0, 90, 30, key='stress_time')
+            axis_labels = {"spot": "Spot shock (%)", "vol": "Volatility shock (vol pts)", "rate": "Rate shift (bp)",
+                           "time": "Time decay (days)"}
+            x_axis = st.selectbox("Horizontal axis", list(axis_labels), index=0, format_func=axis_labels.get, key='stress_x')
+            y_axis = st.selectbox("Vertical axis", [a for a in axis_labels if a != x_axis], index=0,
+                                  format_func=axis_labels.get, key='stress_y')
+            stress_quantity = st.selectbox("Quantity", ["pnl", "price", "delta", "gamma", "theta", "vega", "rho"],
+                                           format_func=lambda q: "P&L" if q == "pnl" else q.capitalize(), key='stress_q')
+
+        if not stress_enabled:
+            stress_col2.caption("Turn on *Compute heatmap* to price the contract under these shocks.")
+        else:
+            with metrics.stage("pricing.stress_cube"):
+                cube = stress_cube(
+                    {"S": np.array([S]), "K": np.array([K]), "T": np.array([T]), "r": np.array([r]),
+                     "sigma": np.array([sigma]), "is_call": np.array([option_type == 'call']),
+                     "quantity": np.array([1.0])},
+                    spot_shocks=np.linspace(-spot_range, spot_range, 21),
+                    vol_shocks=np.linspace(-vol_range, vol_range, 21),
+                    rate_shifts=np.linspace(-rate_range, rate_range, 5),
+                    time_steps=np.linspace(0, decay_days, 7) / 365,
+                )
+            plane = cube.slice2d(stress_quantity, x_axis, y_axis)
+            tick_scale = {"spot": 100, "vol": 100, "rate": 10000, "time": 365}
+            x_vals, y_vals = cube.axes[x_axis] * tick_scale[x_axis], cube.axes[y_axis] * tick_scale[y_axis]
+
+            with stress_col2:
+                stress_title = f"{'P&L' if stress_quantity == 'pnl' else stress_quantity.capitalize()} under stress"
+                stress_image = workers.compute(heatmap, x_vals, y_vals, plane, axis_labels[x_axis],
+                                               axis_labels[y_axis], stress_title)
+                with metrics.stage("streamlit.image"):
+                    st.image(stress_image)
+
+    # Greek surfaces: off until the user asks. A grid that fits the latency budget is drawn in this
+    # rerun; finer grids follow in fragment reruns while the inputs stay put
+    with st.expander("🗺️ Greek Surfaces"):
+        surface_col1, surface_col2 = st.columns([1, 3])
+        with surface_col1:
+            surface_enabled = st.toggle("Compute surfaces", key='surface_enabled')
+            surface_kinds = {"S-T": "Stock Price × Time to Maturity", "K-sigma": "Strike × Volatility"}
+            surface_kind = st.selectbox("Surface", list(surface_kinds), format_func=surface_kinds.get, key='surface_kind')
+            surface_greek = st.selectbox("Greek", ["Delta", "Gamma", "Theta", "Vega", "Rho"], key='surface_greek')
+            surface_style = st.radio("Display", ["Heatmap", "3D"], horizontal=True, key='surface_style')
+            budget_ms = st.slider("Latency budget (ms)", 50, 1000, 250, step=50, key='surface_budget')
+        controller = st.session_state.setdefault("surface_controller", ResolutionController())
+        controller.budget_s = budget_ms / 1000
+
+        if not surface_enabled:
+            surface_col2.caption("Turn on *Compute surfaces* to draw the selected Greek over a grid of inputs.")
+        else:
+            refinement = st.session_state.setdefault("surface_refinement", {"key": None, "n": 0, "pending": []})
+            surface_request = (surface_kind, surface_greek, surface_style, S, K, T, r, sigma, option_type)
+            if refinement["key"] != (surface_request, budget_ms):
+                steps = list(controller.refinement_steps())
+                refinement.update(key=(surface_request, budget_ms), n=steps[0], pending=steps[1:])
+            refinement["advance"] = False
+            with surface_col2:
+                st.fragment(greek_surface_view, run_every=SURFACE_REFINE_EVERY if refinement["pending"] else None)(
+                    controller, refinement, surface_request)
+
+    metrics.observe("app.tab1", time.perf_counter() - rerun_start)
+
+with cache_stats_panel:
+    for cache_name, info in {**cache_stats(), "charts": chart_cache_info(), "surfaces": surface_cache_info()}.items():
+        st.caption(
+            f"**{cache_name}**: {info['hits']} hits / {info['misses']} misses "
+            f"({info['currsize']}/{info['maxsize']} entries)"
+        )
+    worker_stats = workers.stats()
+    if worker_stats is not None:
+        st.caption(
+            f"**workers** ({worker_stats['workers']} processes): {worker_stats['submitted']} computed / "
+            f"{worker_stats['coalesced']} merged in flight / {worker_stats['cached']} cached, "
+            f"{worker_stats['in_flight']} in flight"
+        )
+
 with tab2:
     st.markdown("""
     ## Black-Scholes Model: Mathematical Foundation
@@ -255,7 +365,7 @@ with tab2:
     
     2. **Model Limitations**:
        - Assumes constant volatility (vs real-world stochastic vol)
-       - No early exercise (American options)
+       - No early exercise (American options; `bsgreeks.american_greeks` prices these on a lattice)
        - Log-normal distribution may not match market returns
     
     3. **Empirical Testing**:
@@ -726,3 +836,20 @@ with tab5:
     - **Professional Investors** often combine options with shares to manage risk or speculate, 
       adjusting positions (sometimes daily) to keep their profits and losses more predictable.
     """)
+
+metrics.observe("app.rerun", time.perf_counter() - rerun_start)
+with profiling_panel:
+    if metrics.is_enabled():
+        snapshot = metrics.snapshot()
+        st.dataframe(
+            {name: {"count": t["count"], "mean ms": t["mean"] * 1e3, "p50 ms": t["p50"] * 1e3,
+                    "p99 ms": t["p99"] * 1e3, "total s": t["total"]} for name, t in snapshot["stages"].items()},
+        )
+        for counter, value in snapshot["counters"].items():
+            st.caption(f"**{counter}**: {value}")
+        st.download_button("Download JSON", json.dumps(snapshot, indent=2), "bsgreeks_metrics.json",
+                           mime="application/json")
+        st.download_button("Download Prometheus text", metrics.prometheus_text(), "bsgreeks_metrics.prom",
+                           mime="text/plain")
+        if st.button("Reset timings"):
+            metrics.reset()
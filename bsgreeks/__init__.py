@@ -0,0 +1,51 @@
+"""Headless Black-Scholes pricing core used by the Streamlit app.
+
+Submodules are imported lazily on first attribute access, so
+`from bsgreeks import black_scholes_greeks` loads only NumPy and the
+pricing kernel. It never loads Streamlit, matplotlib or scipy.stats, and
+SciPy itself only loads on the first array-valued CDF call.
+"""
+import importlib
+
+_EXPORTS = {
+    "LatticeResult": "american",
+    "american_greeks": "american",
+    "Greeks": "batch",
+    "black_scholes_greeks": "batch",
+    "black_scholes_greeks_batch": "batch",
+    "black_scholes_greeks_extended": "batch",
+    "black76_greeks": "batch",
+    "garman_kohlhagen_greeks": "batch",
+    "call_mask": "batch",
+    "fused_greeks": "fused",
+    "cache_stats": "cache",
+    "cached_greek_curves": "cache",
+    "cached_greeks": "cache",
+    "clear_caches": "cache",
+    "ImpliedVolResult": "implied_vol",
+    "IncrementalPricer": "incremental",
+    "implied_volatility": "implied_vol",
+    "MonteCarloResult": "monte_carlo",
+    "monte_carlo_price": "monte_carlo",
+    "norm_cdf": "normal",
+    "norm_pdf": "normal",
+    "StressCube": "scenarios",
+    "stress_cube": "scenarios",
+    "ResolutionController": "surfaces",
+    "greek_surface": "surfaces",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,171 @@
+"""Book totals netted by underlying, expiry bucket and strike bucket.
+
+`BookAggregation` prices every position once with
+`black_scholes_greeks_batch`, in chunks. It keeps each position's
+quantity-weighted contribution to price, the Greeks, cash delta
+(delta * S * quantity) and cash gamma (the change in cash delta for a 1%
+spot move, gamma * S^2 * quantity / 100).
+
+Each position gets one flat group code:
+
+    code = (underlying * n_expiry + expiry_bucket) * n_strike + strike_bucket
+
+Buckets come from `np.searchsorted` against a handful of edges, and the totals
+from one `np.bincount(codes, weights=...)` per quantity. Grouping is thus a
+single pass over the book, with no sort. Expiry buckets are by T in years.
+Strike buckets are by moneyness K/S, so they mean the same thing on every
+underlying. `netted(...)` sums the full (underlying, expiry, strike) cube
+down to any subset of those levels.
+
+`update(index, **columns)` reprices only the given rows. For example, S for
+the positions on one underlying after its spot ticks. It subtracts their
+old contributions from their old groups and adds the new ones to the
+groups they now fall in. Repeated updates accumulate rounding like a
+running sum; `refresh()` recomputes the totals from scratch.
+"""
+import numpy as np
+
+from .batch import black_scholes_greeks_batch
+from .portfolio import DEFAULT_CHUNK_SIZE
+
+QUANTITIES = ("price", "delta", "gamma", "theta", "vega", "rho", "delta_cash", "gamma_cash")
+LEVELS = ("underlying", "expiry", "strike")
+# Upper edges: a position falls in the first bucket whose edge is >= T
+EXPIRY_EDGES = {"1w": 7 / 365, "1m": 30 / 365, "3m": 91 / 365, "6m": 182 / 365, "1y": 1.0, "2y": 2.0}
+# Lower edges of moneyness K/S buckets
+MONEYNESS_EDGES = (0.8, 0.9, 0.97, 1.03, 1.1, 1.2)
+INPUT_COLUMNS = ("S", "K", "T", "r", "sigma", "is_call", "quantity")
+
+
+def _expiry_labels(edges):
+    names = list(edges)
+    return [f"<={names[0]}"] + [f"{a}-{b}" for a, b in zip(names, names[1:])] + [f">{names[-1]}"]
+
+
+def _moneyness_labels(edges):
+    return [f"<{edges[0]:g}"] + [f"{a:g}-{b:g}" for a, b in zip(edges, edges[1:])] + [f">={edges[-1]:g}"]
+
+
+def _rows(index, n):
+    # Integer row numbers without building an n-sized arange for a small update
+    if isinstance(index, slice):
+        return np.arange(*index.indices(n))
+    index = np.asarray(index)
+    return np.flatnonzero(index) if index.dtype == bool else index.astype(np.intp, copy=False)
+
+
+class BookAggregation:
+    """Greek totals of a position book on an (underlying, expiry bucket, strike bucket) grid.
+
+    `positions` holds S, K, T, r, sigma, is_call and quantity arrays, as from
+    `read_positions`, or is a `PositionStore`. It may also hold "underlying"
+    integer codes with their names in "underlying_labels". Without
+    "underlying" the whole book is one underlying. The input columns are
+    copied, because `update` writes into them.
+    """
+
+    def __init__(self, positions, expiry_edges=EXPIRY_EDGES, moneyness_edges=MONEYNESS_EDGES,
+                 chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.float64):
+        self.columns = {name: np.array(positions[name]) for name in INPUT_COLUMNS}
+        n = len(self.columns["S"])
+        if "underlying" in positions:
+            self.underlying = np.asarray(positions["underlying"], dtype=np.intp)
+            labels = positions["underlying_labels"] if "underlying_labels" in positions else None
+            n_underlying = len(labels) if labels is not None else int(self.underlying.max(initial=-1)) + 1
+        else:
+            self.underlying, labels, n_underlying = np.zeros(n, dtype=np.intp), None, 1
+        self.expiry_edges = np.asarray(list(expiry_edges.values()), dtype=float)
+        self.moneyness_edges = np.asarray(moneyness_edges, dtype=float)
+        self.labels = {
+            "underlying": list(labels) if labels is not None else list(range(n_underlying)),
+            "expiry": _expiry_labels(expiry_edges),
+            "strike": _moneyness_labels(moneyness_edges),
+        }
+        self.shape = tuple(len(self.labels[level]) for level in LEVELS)
+        self.chunk_size = chunk_size
+        self.dtype = dtype
+        # Quantity-major, so each bincount reads one contiguous row
+        self.contributions = np.empty((len(QUANTITIES), n))
+        self.codes = np.empty(n, dtype=np.intp)
+        self.refresh()
+
+    def _evaluate(self, index):
+        # Contributions and group codes of the rows in `index`
+        c = {name: values[index] for name, values in self.columns.items()}
+        greeks = black_scholes_greeks_batch(c["S"], c["K"], c["T"], c["r"], c["sigma"], c["is_call"], dtype=self.dtype)
+        q = c["quantity"]
+        out = np.empty((len(QUANTITIES), len(q)))
+        for row, values in enumerate(greeks):
+            np.multiply(values, q, out=out[row])
+        out[6] = out[1] * c["S"]
+        out[7] = out[2] * c["S"] * c["S"] / 100
+        n_expiry, n_strike = self.shape[1:]
+        expiry = np.searchsorted(self.expiry_edges, c["T"], side='left')
+        strike = np.searchsorted(self.moneyness_edges, c["K"] / c["S"], side='right')
+        codes = (self.underlying[index] * n_expiry + expiry) * n_strike + strike
+        return out, codes
+
+    def _accumulate(self, codes, contributions, sign=1.0):
+        size = self.totals.shape[0]
+        self.counts += int(sign) * np.bincount(codes, minlength=size)
+        for row, weights in enumerate(contributions):
+            self.totals[:, row] += sign * np.bincount(codes, weights=weights, minlength=size)
+
+    def refresh(self):
+        """Reprice every position and rebuild the totals."""
+        n = len(self.codes)
+        for start in range(0, n, self.chunk_size):
+            part = slice(start, min(start + self.chunk_size, n))
+            self.contributions[:, part], self.codes[part] = self._evaluate(part)
+        self.totals = np.zeros((int(np.prod(self.shape)), len(QUANTITIES)))
+        self.counts = np.zeros(self.totals.shape[0], dtype=np.int64)
+        self._accumulate(self.codes, self.contributions)
+        return self
+
+    def update(self, index, **columns):
+        """Set `columns` (e.g. S=new_spots) on the rows in `index` and re-aggregate just those rows.
+
+        `index` is an integer array of distinct rows, a slice or a boolean mask.
+        Each value broadcasts against the selected rows.
+        """
+        unknown = set(columns) - set(INPUT_COLUMNS)
+        if unknown:
+            raise TypeError(f"Unknown column(s): {', '.join(sorted(unknown))}")
+        index = _rows(index, len(self.codes))
+        for name, values in columns.items():
+            self.columns[name][index] = values
+        self._accumulate(self.codes[index], self.contributions[:, index], sign=-1.0)
+        contributions, codes = self._evaluate(index)
+        self.contributions[:, index], self.codes[index] = contributions, codes
+        self._accumulate(codes, contributions)
+        return self
+
+    def rows_of(self, underlying):
+        """Row indices of the positions on one underlying (a label, or a code when unlabelled)."""
+        return np.flatnonzero(self.underlying == self.labels["underlying"].index(underlying))
+
+    def cube(self):
+        """Totals as an array of shape (n_underlying, n_expiry, n_strike, len(QUANTITIES))."""
+        return self.totals.reshape(*self.shape, len(QUANTITIES))
+
+    def netted(self, *levels):
+        """Totals summed over every level not named, e.g. netted("underlying") or netted("expiry", "strike").
+
+        Returns (labels, values, counts): one label tuple per non-empty group
+        in `levels` order, a (n_groups, len(QUANTITIES)) array, and the
+        position count of each group.
+        """
+        unknown = set(levels) - set(LEVELS)
+        if unknown:
+            raise ValueError(f"Unknown level(s): {', '.join(sorted(unknown))}; choose from {LEVELS}")
+        drop = tuple(axis for axis, level in enumerate(LEVELS) if level not in levels)
+        keep = [LEVELS.index(level) for level in levels]
+        values = self.cube().sum(axis=drop)
+        counts = self.counts.reshape(self.shape).sum(axis=drop)
+        # The kept axes come out in LEVELS order; put them in the order asked for
+        order = [keep.index(axis) for axis in sorted(keep)]
+        values = np.moveaxis(values, list(range(len(keep))), order)
+        counts = np.moveaxis(counts, list(range(len(keep))), order)
+        groups = np.argwhere(counts > 0)
+        labels = [tuple(self.labels[level][i] for level, i in zip(levels, group)) for group in groups]
+        return labels, values[tuple(groups.T)], counts[tuple(groups.T)]
@@ -0,0 +1,242 @@
+import numpy as np
+from typing import NamedTuple
+
+from .normal import norm_cdf, norm_pdf
+
+
+class Greeks(NamedTuple):
+    """Struct-of-arrays result: one array per quantity, all the same shape."""
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    theta: np.ndarray
+    vega: np.ndarray
+    rho: np.ndarray
+
+
+def call_mask(option_type):
+    """Turn 'call'/'put' labels (scalar or array) into a boolean call mask."""
+    return np.asarray(option_type) == 'call'
+
+
+def _broadcast_inputs(S, K, T, r, sigma, is_call, q, dtype):
+    q = np.asarray(q, dtype=dtype)
+    carry = bool(np.any(q))
+    S, K, T, r, sigma, is_call, q = np.broadcast_arrays(
+        np.asarray(S, dtype=dtype), np.asarray(K, dtype=dtype),
+        np.asarray(T, dtype=dtype), np.asarray(r, dtype=dtype),
+        np.asarray(sigma, dtype=dtype), np.asarray(is_call, dtype=bool), q,
+    )
+    return S, K, T, r, sigma, is_call, q, carry
+
+
+# Rows with sigma * sqrt(T) below this (expiry, zero vol) are priced at their limit
+MIN_SIG_SQRT_T = 1e-12
+# Stand-in for d = +/-inf: N(40) is exactly 1 and N'(40) exactly 0, yet d1 * d2 stays finite
+LIMIT_D = 40.0
+
+
+def _d1_d2(S, K, T, b, sigma):
+    """d1 and d2, plus sqrt(T) and sigma*sqrt(T) that are safe to divide by.
+
+    Where sigma*sqrt(T) is (near) zero the forward F = S e^{bT} is
+    deterministic. There d1 and d2 become +/-LIMIT_D by the sign of ln(F/K)
+    (0 exactly at the forward), so N(w d) is the 0/1 step, and 1 is added to
+    both divisors. The returned mask is None when no row is degenerate, so
+    regular books pay a single comparison. Other books take a masked path.
+    Adding the mask is exact on regular rows and costs the same for any mix
+    of rows, but d1 and d2 are still picked with np.where, which slows down
+    on an unpredictable mask. Measured with benchmarks/bench_degenerate.py,
+    a book with half its rows degenerate costs some 10-15% more than one
+    with 1% or all of them.
+    """
+    sqrt_T = np.sqrt(T)
+    sig_sqrt_T = sigma * sqrt_T
+    degenerate = sig_sqrt_T < MIN_SIG_SQRT_T
+    log_moneyness = np.log(S / K)
+    if not degenerate.any():
+        d1 = (log_moneyness + (b + 0.5 * sigma**2) * T) / sig_sqrt_T
+        return d1, d1 - sig_sqrt_T, sqrt_T, sig_sqrt_T, None
+    step = LIMIT_D * np.sign(log_moneyness + b * T)
+    sqrt_T = sqrt_T + degenerate
+    sig_sqrt_T = sig_sqrt_T + degenerate
+    d1 = (log_moneyness + (b + 0.5 * sigma**2) * T) / sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    return np.where(degenerate, step, d1), np.where(degenerate, step, d2), sqrt_T, sig_sqrt_T, degenerate
+
+
+def _density(d1, degenerate):
+    """N'(d1), zero on degenerate rows.
+
+    Exactly at the forward d is 0, but the density has collapsed to a point.
+    The density is taken at 0 rather than at +/-LIMIT_D on those rows, which
+    keeps np.exp off its slow underflow path.
+    """
+    if degenerate is None:
+        return norm_pdf(d1)
+    regular = ~degenerate
+    return norm_pdf(d1 * regular) * regular
+
+
+def _call_sign(is_call, dtype):
+    # Scalars of the working dtype, so a float32 book is not promoted by w
+    one = np.dtype(dtype).type(1)
+    return np.where(is_call, one, -one)
+
+
+def black_scholes_greeks_batch(S, K, T, r, sigma, is_call=True, q=0.0, dtype=np.float64):
+    """Price and first-order Greeks for a whole batch of European options.
+
+    Every argument is broadcast against the others, so a book can mix
+    scalars (e.g. one spot) with per-contract arrays. `is_call` is a boolean
+    mask selecting calls (True) or puts (False) row by row.
+
+    `q` is a continuous carry (Merton): a dividend yield for stocks and
+    indices, the foreign rate for FX (Garman-Kohlhagen), or r itself for
+    options on futures (Black-76). See `black76_greeks` and
+    `garman_kohlhagen_greeks`. Rho is the sensitivity to r with q held fixed.
+
+    Calls and puts share one set of formulas through the sign w = +1/-1:
+        price = w * (S e^{-qT} N(w d1) - K e^{-rT} N(w d2))
+        delta = w * e^{-qT} N(w d1)
+        rho   = w * K T e^{-rT} N(w d2)
+        theta = -S e^{-qT} N'(d1) sigma / (2 sqrt(T)) - w r K e^{-rT} N(w d2)
+                + w q S e^{-qT} N(w d1)
+    so d1, d2, the two CDFs, the PDF and the discount factor are each
+    evaluated exactly once, with no Python-level branching. When q is zero
+    everywhere the carry terms are skipped. The result is then bit-for-bit
+    the plain Black-Scholes output and costs nothing extra.
+
+    Rows at expiry (T = 0) or with zero vol get their limits in the same
+    pass: the discounted intrinsic value of the deterministic forward, a step
+    delta, and zero gamma and vega. See `_d1_d2`. Deep ITM/OTM rows need no
+    special case, since N(w d) is never formed as 1 - N(d).
+
+    `dtype=np.float32` runs every step, the CDF included, in single precision.
+    That halves memory traffic on large books. Over S, K in [50, 150],
+    T in [0.02, 3], sigma in [0.05, 1] and r in [0, 0.1], the difference from
+    float64 stays below 1e-6 * S for price, theta and vega, 3e-6 * S for
+    rho, 5e-6 for delta and 1e-4 relative for gamma (see
+    tests/test_precision.py). Quantity-weighted sums over such books
+    should still be accumulated in float64.
+    """
+    S, K, T, r, sigma, is_call, q, carry = _broadcast_inputs(S, K, T, r, sigma, is_call, q, dtype)
+    w = _call_sign(is_call, dtype)
+    d1, d2, sqrt_T, sig_sqrt_T, degenerate = _d1_d2(S, K, T, r - q if carry else r, sigma)
+
+    K_df = K * np.exp(-r * T)
+    N1 = norm_cdf(w * d1)
+    N2 = norm_cdf(w * d2)
+    n1 = _density(d1, degenerate)
+    if carry:
+        q_df = np.exp(-q * T)
+        N1 = q_df * N1
+        n1 = q_df * n1
+    K_df_N2 = K_df * N2
+
+    price = w * (S * N1 - K_df_N2)
+    delta = w * N1
+    gamma = n1 / (S * sig_sqrt_T)
+    vega = S * n1 * sqrt_T
+    theta = -(S * n1 * sigma) / (2 * sqrt_T) - w * r * K_df_N2
+    if carry:
+        theta = theta + w * q * S * N1
+    rho = w * T * K_df_N2
+
+    # [()] unwraps 0-d results to numpy scalars and leaves arrays untouched
+    return Greeks(price[()], delta[()], gamma[()], theta[()], vega[()], rho[()])
+
+
+def black_scholes_greeks(S, K, T, r, sigma, option_type='call', q=0.0):
+    """(price, delta, gamma, theta, vega, rho) for a call or put; scalar-friendly wrapper."""
+    return tuple(black_scholes_greeks_batch(S, K, T, r, sigma, option_type == 'call', q))
+
+
+def black76_greeks(F, K, T, r, sigma, is_call=True, dtype=np.float64):
+    """Black-76 options on a futures price F: the batch kernel with carry q = r.
+
+    Delta and gamma are with respect to F. Rho is the full sensitivity to r:
+    with F held fixed, r only discounts, so rho = -T * price.
+    """
+    greeks = black_scholes_greeks_batch(F, K, T, r, sigma, is_call, q=r, dtype=dtype)
+    return greeks._replace(rho=(-np.asarray(T, dtype=dtype) * greeks.price)[()])
+
+
+def garman_kohlhagen_greeks(S, K, T, r_domestic, r_foreign, sigma, is_call=True, dtype=np.float64):
+    """Garman-Kohlhagen FX options: the batch kernel with carry q = r_foreign.
+
+    Rho is the sensitivity to the domestic rate.
+    """
+    return black_scholes_greeks_batch(S, K, T, r_domestic, sigma, is_call, q=r_foreign, dtype=dtype)
+
+
+FIRST_ORDER = Greeks._fields
+HIGHER_ORDER = ("vanna", "volga", "charm", "speed", "color", "zomma")
+GREEK_ALIASES = {"vomma": "volga"}
+
+
+def black_scholes_greeks_extended(S, K, T, r, sigma, is_call=True, greeks=None, q=0.0, dtype=np.float64):
+    """Any subset of first- and higher-order Greeks in one vectorized pass.
+
+    `greeks` lists the wanted names from FIRST_ORDER + HIGHER_ORDER ("vomma"
+    is accepted for "volga"); None means all of them. d1, d2, N'(d1) and
+    gamma are computed once and shared, and the CDFs and discount factor
+    are computed only if a requested Greek needs them. `q` is the same
+    continuous carry as in `black_scholes_greeks_batch`, and `dtype` the same
+    precision option. Returns a dict name -> array.
+
+    Time derivatives follow the same convention as theta: charm and color
+    are the change of delta and gamma as calendar time passes (-d/dT).
+    """
+    wanted = FIRST_ORDER + HIGHER_ORDER if greeks is None else tuple(GREEK_ALIASES.get(g, g) for g in greeks)
+    unknown = set(wanted) - set(FIRST_ORDER + HIGHER_ORDER)
+    if unknown:
+        raise ValueError(f"Unknown Greek(s): {', '.join(sorted(unknown))}")
+
+    S, K, T, r, sigma, is_call, q, carry = _broadcast_inputs(S, K, T, r, sigma, is_call, q, dtype)
+    w = _call_sign(is_call, dtype)
+    b = r - q if carry else r  # cost of carry
+    d1, d2, sqrt_T, sig_sqrt_T, degenerate = _d1_d2(S, K, T, b, sigma)
+    q_df = np.exp(-q * T) if carry else 1.0
+    n1 = q_df * _density(d1, degenerate)
+    # Divisors for the higher-order Greeks; every term they divide is 0 on degenerate rows
+    T_div, sigma_div = T, sigma
+    if degenerate is not None:
+        T_div, sigma_div = np.where(degenerate, 1.0, T), np.where(degenerate, 1.0, sigma)
+
+    out = {}
+    if {"price", "delta", "theta", "charm"} & set(wanted):
+        N1 = q_df * norm_cdf(w * d1)
+        out["delta"] = w * N1
+    if {"price", "theta", "rho"} & set(wanted):
+        K_df_N2 = K * np.exp(-r * T) * norm_cdf(w * d2)
+    if "price" in wanted:
+        out["price"] = w * (S * N1 - K_df_N2)
+    if {"gamma", "speed", "color", "zomma"} & set(wanted):
+        gamma = n1 / (S * sig_sqrt_T)
+        out["gamma"] = gamma
+    if {"vega", "volga"} & set(wanted):
+        vega = S * n1 * sqrt_T
+        out["vega"] = vega
+    if "theta" in wanted:
+        out["theta"] = -(S * n1 * sigma) / (2 * sqrt_T) - w * r * K_df_N2 + w * q * S * N1
+    if "rho" in wanted:
+        out["rho"] = w * T * K_df_N2
+
+    if "vanna" in wanted:
+        out["vanna"] = -n1 * d2 / sigma_div
+    if "volga" in wanted:
+        out["volga"] = vega * d1 * d2 / sigma_div
+    if {"charm", "color"} & set(wanted):
+        # Shared factor dd1/dT = (2bT - d2 sigma sqrt(T)) / (2T sigma sqrt(T))
+        drift = (2 * b * T - d2 * sig_sqrt_T) / (2 * T_div * sig_sqrt_T)
+    if "charm" in wanted:
+        out["charm"] = w * q * N1 - n1 * drift
+    if "speed" in wanted:
+        out["speed"] = -gamma / S * (d1 / sig_sqrt_T + 1)
+    if "color" in wanted:
+        out["color"] = gamma * (q + 1 / (2 * T_div) + d1 * drift)
+    if "zomma" in wanted:
+        out["zomma"] = gamma * (d1 * d2 - 1) / sigma_div
+
+    return {name: out[name][()] for name in wanted}
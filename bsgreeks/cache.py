@@ -0,0 +1,95 @@
+"""Process-wide LRU caches for the Interactive Tool.
+
+Streamlit reruns the whole script on every widget interaction, including
+ones that do not touch the model inputs (e.g. picking another Greek to
+plot). Because these caches live at module level they survive reruns and are
+shared by every session in the server process.
+
+Keys are the quantized parameter tuple, so float noise from the sliders
+does not fragment the cache. All Greeks are stored together: switching
+the plotted Greek, or going back to an earlier setting, is a dictionary
+lookup. The curve key leaves out the spot price, because the curve runs
+over a fixed S grid; dragging the S slider therefore reuses the curves.
+
+A curve cache miss goes through one process-wide `IncrementalPricer`. That
+way moving a single slider (sigma, r, T or K) recomputes only the
+intermediates that depend on it, and ln(S/K) or the discount factor come
+from the previous curve.
+"""
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from .batch import black_scholes_greeks_batch
+from .incremental import IncrementalPricer
+from .metrics import count, stage
+
+CACHE_SIZE = 256
+QUANTUM_DIGITS = 6
+
+
+def quantize(x):
+    """Round a model input so slider float noise maps to one cache key."""
+    return round(float(x), QUANTUM_DIGITS)
+
+
+def _freeze(greeks):
+    # Cached arrays are shared between sessions, so make accidental writes fail loudly
+    for values in greeks:
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+    return greeks
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _headline(S, K, T, r, sigma, is_call):
+    count("cache.greeks.miss")
+    with stage("pricing.greeks"):
+        return black_scholes_greeks_batch(S, K, T, r, sigma, is_call)
+
+
+_curve_pricer = None
+_curve_lock = threading.Lock()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _curves(S_min, S_max, n_points, K, T, r, sigma, is_call):
+    global _curve_pricer
+    count("cache.curves.miss")
+    with stage("pricing.curves"):
+        S_range = np.linspace(S_min, S_max, n_points)
+        S_range.flags.writeable = False
+        # Shared by all sessions; a miss from another session just changes more inputs at once
+        with _curve_lock:
+            if _curve_pricer is None:
+                _curve_pricer = IncrementalPricer(S_range, K, T, r, sigma, is_call)
+            else:
+                _curve_pricer.update(S=S_range, K=K, T=T, r=r, sigma=sigma, is_call=is_call)
+            return S_range, _freeze(_curve_pricer.greeks())
+
+
+def cached_greeks(S, K, T, r, sigma, option_type='call'):
+    """Price and Greeks for one contract, memoized on the quantized inputs."""
+    count("cache.greeks.lookup")
+    return _headline(*map(quantize, (S, K, T, r, sigma)), option_type == 'call')
+
+
+def cached_greek_curves(S_min, S_max, n_points, K, T, r, sigma, option_type='call'):
+    """(S_range, Greeks) over an S grid. All five Greek curves are cached together."""
+    count("cache.curves.lookup")
+    return _curves(quantize(S_min), quantize(S_max), int(n_points),
+                   *map(quantize, (K, T, r, sigma)), option_type == 'call')
+
+
+def cache_stats():
+    """Hit/miss/size counters for each cache, keyed by cache name."""
+    return {name: fn.cache_info()._asdict() for name, fn in (("greeks", _headline), ("curves", _curves))}
+
+
+def clear_caches():
+    global _curve_pricer
+    _headline.cache_clear()
+    _curves.cache_clear()
+    with _curve_lock:
+        _curve_pricer = None
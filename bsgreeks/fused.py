@@ -0,0 +1,112 @@
+"""Fused single-pass pricing kernel, JIT-compiled with Numba when it is installed.
+
+`black_scholes_greeks_batch` evaluates an expression tree. Every
+intermediate (sqrt(T), d1, d2, both CDFs, the density, the discount
+factor...) is a full-size temporary array, so a large book streams through
+memory about a dozen times. `fused_greeks` computes price and all five
+Greeks of a contract in one loop iteration, reading each input once and
+writing each output once. With `numba.njit(parallel=True)` the loop is
+spread over all cores. fastmath stays off, so results match the NumPy path
+to rounding (see tests/test_fused.py).
+
+Scalar inputs are not broadcast to full arrays: the kernel reads element 0
+of a 1-element input. A float32 book is read and written in float32. The
+arithmetic inside the loop runs in double, so float32 results are
+float64 results rounded once.
+
+Numba is optional. It is imported, and the kernel compiled (cached on
+disk), on the first call. Without it, or with BSGREEKS_JIT=0 set,
+`fused_greeks` is `black_scholes_greeks_batch`.
+"""
+import math
+import os
+
+import numpy as np
+
+from .batch import LIMIT_D, MIN_SIG_SQRT_T, Greeks, black_scholes_greeks_batch
+
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+# None: not tried yet, False: Numba missing or disabled, else the compiled kernel
+_kernel = None if os.environ.get("BSGREEKS_JIT") != "0" else False
+prange = range  # numba.prange once compiled; the kernel resolves it at compile time
+
+
+def _loop(S, K, T, r, sigma, is_call, q, out):
+    n = out.shape[1]
+    # 1-element inputs are scalars broadcast over the whole book: step 0 instead of 1
+    sS, sK, sT, sr = int(S.size > 1), int(K.size > 1), int(T.size > 1), int(r.size > 1)
+    ss, sc, sq = int(sigma.size > 1), int(is_call.size > 1), int(q.size > 1)
+    for i in prange(n):
+        # np.float64, not float(): under Numba float() keeps a float32 a float32
+        s, k, t = np.float64(S[i * sS]), np.float64(K[i * sK]), np.float64(T[i * sT])
+        rr, sig, qq = np.float64(r[i * sr]), np.float64(sigma[i * ss]), np.float64(q[i * sq])
+        w = 1.0 if is_call[i * sc] else -1.0
+        sqrt_T = math.sqrt(t)
+        sig_sqrt_T = sig * sqrt_T
+        log_moneyness = math.log(s / k)
+        if sig_sqrt_T < MIN_SIG_SQRT_T:
+            # Deterministic forward: the same limits as batch._d1_d2
+            drift = log_moneyness + (rr - qq) * t
+            d1 = LIMIT_D if drift > 0 else (-LIMIT_D if drift < 0 else 0.0)
+            d2 = d1
+            sqrt_T = sig_sqrt_T = 1.0
+            n1 = 0.0
+        else:
+            d1 = (log_moneyness + (rr - qq + 0.5 * sig * sig) * t) / sig_sqrt_T
+            d2 = d1 - sig_sqrt_T
+            n1 = _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+        q_df = math.exp(-qq * t)
+        N1 = q_df * 0.5 * math.erfc(-w * d1 * _INV_SQRT_2)
+        n1 = q_df * n1
+        K_df_N2 = k * math.exp(-rr * t) * 0.5 * math.erfc(-w * d2 * _INV_SQRT_2)
+        out[0, i] = w * (s * N1 - K_df_N2)
+        out[1, i] = w * N1
+        out[2, i] = n1 / (s * sig_sqrt_T)
+        out[3, i] = -(s * n1 * sig) / (2 * sqrt_T) - w * rr * K_df_N2 + w * qq * s * N1
+        out[4, i] = s * n1 * sqrt_T
+        out[5, i] = w * t * K_df_N2
+
+
+def _compile():
+    global _kernel, prange
+    try:
+        import numba
+    except ImportError:
+        _kernel = False
+        return
+    prange = numba.prange
+    _kernel = numba.njit(parallel=True, fastmath=False, cache=True)(_loop)
+
+
+def jit_available():
+    """True if the Numba kernel is in use (this compiles it on first call)."""
+    if _kernel is None:
+        _compile()
+    return _kernel is not False
+
+
+def _flat(a, shape):
+    # 1-element and full-size inputs go in as views; only partial broadcasts are expanded
+    if a.size == 1:
+        return a.reshape(1)
+    if a.shape != shape:
+        a = np.broadcast_to(a, shape)
+    return np.ascontiguousarray(a).reshape(-1)
+
+
+def fused_greeks(S, K, T, r, sigma, is_call=True, q=0.0, dtype=np.float64):
+    """Price and first-order Greeks, like `black_scholes_greeks_batch`, in one fused pass.
+
+    Same arguments, broadcasting, degenerate-row limits and `Greeks` result.
+    Falls back to `black_scholes_greeks_batch` when Numba is unavailable.
+    """
+    if not jit_available():
+        return black_scholes_greeks_batch(S, K, T, r, sigma, is_call, q, dtype)
+    inputs = [np.asarray(a, dtype=dtype) for a in (S, K, T, r, sigma)]
+    inputs += [np.asarray(is_call, dtype=bool), np.asarray(q, dtype=dtype)]
+    shape = np.broadcast_shapes(*(a.shape for a in inputs))
+    out = np.empty((len(Greeks._fields), math.prod(shape)), dtype=dtype)
+    _kernel(*(_flat(a, shape) for a in inputs), out)
+    return Greeks(*(values.reshape(shape)[()] for values in out))
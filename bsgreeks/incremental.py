@@ -0,0 +1,134 @@
+"""Dependency-aware revaluation: recompute only what a changed input touches.
+
+The closed form is written as a small graph of named intermediates, e.g.
+`K_df = K e^{-rT}`, `sig_sqrt_T = sigma sqrt(T)`,
+`log_moneyness = ln(S/K)`, `n1 = N'(d1)`. Each node lists the inputs or
+nodes it reads. `IncrementalPricer` keeps every node from the last
+evaluation. `update` drops only the nodes that depend, directly or
+transitively, on an input whose value actually changed. `greeks` recomputes
+just those. When spot moves, the discount factors, sqrt(T), sigma sqrt(T)
+and the carry term are reused. When vol moves, ln(S/K), the discount
+factors and the carry term are reused.
+
+Inputs are kept at their own shapes instead of being broadcast. A scalar
+K, T or r therefore keeps `K_df` and the other terms that depend only on
+it scalar. Degenerate rows (sigma sqrt(T) ~ 0) get the same limits as in
+`black_scholes_greeks_batch`. Results agree with the batch pricer to
+rounding; d1 is assembled from the cached terms in a different order.
+"""
+import numpy as np
+
+from .batch import LIMIT_D, MIN_SIG_SQRT_T, Greeks
+from .normal import norm_cdf, norm_pdf
+
+INPUTS = ("S", "K", "T", "r", "sigma", "is_call", "q")
+
+
+def _degenerate(sig_sqrt_T):
+    mask = sig_sqrt_T < MIN_SIG_SQRT_T
+    return mask if mask.any() else None
+
+
+def _safe(values, degenerate):
+    return values if degenerate is None else np.where(degenerate, 1.0, values)
+
+
+def _d1(log_moneyness, carry, sig_sqrt_T, degenerate):
+    drift = log_moneyness + carry
+    if degenerate is None:
+        return drift / sig_sqrt_T + 0.5 * sig_sqrt_T
+    d1 = drift / _safe(sig_sqrt_T, degenerate) + 0.5 * sig_sqrt_T
+    return np.where(degenerate, LIMIT_D * np.sign(drift), d1)
+
+
+def _d2(d1, sig_sqrt_T, degenerate):
+    return d1 - sig_sqrt_T if degenerate is None else np.where(degenerate, d1, d1 - sig_sqrt_T)
+
+
+def _n1(d1, q_df, degenerate):
+    n1 = q_df * norm_pdf(d1)
+    return n1 if degenerate is None else np.where(degenerate, 0.0, n1)
+
+
+# name -> (dependencies, function of their values), in topological order
+NODES = {
+    # int8 signs take on the dtype of whatever they multiply, so float32 books stay float32
+    "w": (("is_call",), lambda is_call: np.where(is_call, np.int8(1), np.int8(-1))),
+    "sqrt_T": (("T",), np.sqrt),
+    "sig_sqrt_T": (("sigma", "sqrt_T"), np.multiply),
+    "degenerate": (("sig_sqrt_T",), _degenerate),
+    "log_moneyness": (("S", "K"), lambda S, K: np.log(S / K)),
+    "carry": (("r", "q", "T"), lambda r, q, T: (r - q) * T),
+    "K_df": (("K", "r", "T"), lambda K, r, T: K * np.exp(-r * T)),
+    "q_df": (("q", "T"), lambda q, T: np.exp(-q * T)),
+    "d1": (("log_moneyness", "carry", "sig_sqrt_T", "degenerate"), _d1),
+    "d2": (("d1", "sig_sqrt_T", "degenerate"), _d2),
+    "N1": (("w", "d1", "q_df"), lambda w, d1, q_df: q_df * norm_cdf(w * d1)),
+    "K_df_N2": (("w", "d2", "K_df"), lambda w, d2, K_df: K_df * norm_cdf(w * d2)),
+    "n1": (("d1", "q_df", "degenerate"), _n1),
+    "price": (("w", "S", "N1", "K_df_N2"), lambda w, S, N1, K_df_N2: w * (S * N1 - K_df_N2)),
+    "delta": (("w", "N1"), np.multiply),
+    "gamma": (("n1", "S", "sig_sqrt_T", "degenerate"),
+              lambda n1, S, sig_sqrt_T, degenerate: n1 / (S * _safe(sig_sqrt_T, degenerate))),
+    "theta": (("w", "S", "n1", "sigma", "sqrt_T", "degenerate", "r", "q", "N1", "K_df_N2"),
+              lambda w, S, n1, sigma, sqrt_T, degenerate, r, q, N1, K_df_N2:
+              -(S * n1 * sigma) / (2 * _safe(sqrt_T, degenerate)) - w * r * K_df_N2 + w * q * S * N1),
+    "vega": (("S", "n1", "sqrt_T"), lambda S, n1, sqrt_T: S * n1 * sqrt_T),
+    "rho": (("w", "T", "K_df_N2"), lambda w, T, K_df_N2: w * T * K_df_N2),
+}
+
+
+def _dependents():
+    # Transitive closure, input -> every node that must be recomputed when it changes
+    out = {name: set() for name in INPUTS}
+    for node, (deps, _) in NODES.items():
+        for dep in deps:
+            for name, reached in out.items():
+                if dep == name or dep in reached:
+                    reached.add(node)
+    return out
+
+
+DEPENDENTS = _dependents()
+
+
+class IncrementalPricer:
+    """Price and Greeks that are recomputed only along the paths a changed input touches.
+
+    Inputs broadcast like `black_scholes_greeks_batch`. `update(**inputs)`
+    compares each new value with the current one and invalidates only when it
+    differs. `recomputed` lists the nodes evaluated by the last `greeks()`.
+    Node arrays are never modified in place, so results may be shared freely.
+    """
+
+    def __init__(self, S, K, T, r, sigma, is_call=True, q=0.0, dtype=np.float64):
+        self.dtype = dtype
+        self.inputs = {}
+        self.nodes = {}
+        self.recomputed = []
+        self.update(S=S, K=K, T=T, r=r, sigma=sigma, is_call=is_call, q=q)
+
+    def update(self, **inputs):
+        unknown = set(inputs) - set(INPUTS)
+        if unknown:
+            raise TypeError(f"Unknown input(s): {', '.join(sorted(unknown))}")
+        for name, value in inputs.items():
+            value = np.asarray(value, dtype=bool if name == "is_call" else self.dtype)
+            old = self.inputs.get(name)
+            if old is not None and old.shape == value.shape and np.array_equal(old, value):
+                continue
+            self.inputs[name] = value
+            for node in DEPENDENTS[name]:
+                self.nodes.pop(node, None)
+        return self
+
+    def greeks(self):
+        self.recomputed = []
+        values = {**self.inputs, **self.nodes}
+        for name, (deps, fn) in NODES.items():
+            if name not in values:
+                values[name] = self.nodes[name] = fn(*(values[dep] for dep in deps))
+                self.recomputed.append(name)
+        shape = np.broadcast_shapes(*(value.shape for value in self.inputs.values()))
+        # Each output is already full-size unless every input feeding it is scalar
+        return Greeks(*(np.broadcast_to(values[name], shape)[()] for name in Greeks._fields))
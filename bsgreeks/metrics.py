@@ -0,0 +1,185 @@
+"""Opt-in per-stage timing and counters for the app rerun and the pricing pipeline.
+
+Code marks a stage with `with stage("render.encode"): ...` and an event with
+`count("cache.charts.lookup")`. While profiling is disabled, the default
+unless BSGREEKS_PROFILE=1 is set, `stage` returns one shared no-op context
+manager and `count` returns at once. The instrumented hot paths then pay a
+function call and a flag test: under 100 ns for `count` and `observe`, and
+up to about half a microsecond for a `with stage(...)` block, most of it
+the context-manager protocol (see benchmarks/bench_metrics.py). Keep stages
+off per-element loops.
+
+When enabled, every stage feeds a process-wide `LatencyHistogram`, shared
+by all Streamlit sessions in the server. `snapshot()` summarizes the
+registry. `write()` exports it as JSON or Prometheus text, chosen by the
+file suffix. `serve()` exposes the Prometheus text at /metrics for a scraper.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+import numpy as np
+
+PREFIX = "bsgreeks"
+_NOOP = nullcontext()
+
+_enabled = os.environ.get("BSGREEKS_PROFILE") == "1"
+_lock = threading.Lock()
+_histograms = {}
+_counters = {}
+
+
+class LatencyHistogram:
+    """Fixed log-spaced buckets from 1 us to 10 s; memory does not grow with the number of samples."""
+
+    def __init__(self, low=1e-6, high=10.0, buckets_per_decade=20):
+        decades = np.log10(high / low)
+        self.edges = low * 10.0 ** (np.arange(int(decades * buckets_per_decade) + 1) / buckets_per_decade)
+        self.counts = np.zeros(self.edges.size + 1, dtype=np.int64)
+        self.sum = 0.0
+
+    def record(self, seconds):
+        self.counts[np.searchsorted(self.edges, seconds)] += 1
+        self.sum += seconds
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def percentile(self, p):
+        """Upper bucket edge below which `p` percent of recorded latencies fall."""
+        if self.total == 0:
+            return float('nan')
+        bucket = int(np.searchsorted(np.cumsum(self.counts), p / 100.0 * self.total))
+        return float(self.edges[min(bucket, self.edges.size - 1)])
+
+    def summary(self):
+        return {"count": self.total, "p50": self.percentile(50), "p99": self.percentile(99)}
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = bool(on)
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+
+
+def observe(name, seconds):
+    """Record a duration measured by the caller, e.g. across a whole script rerun."""
+    if not _enabled:
+        return
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = LatencyHistogram(buckets_per_decade=4)
+        histogram.record(seconds)
+
+
+def count(name, n=1):
+    if _enabled:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + n
+
+
+class _Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def stage(name):
+    """Context manager timing its block into the `name` histogram; a shared no-op while disabled."""
+    return _Stage(name) if _enabled else _NOOP
+
+
+def snapshot():
+    """{"stages": {name: count/total/mean/p50/p99 in seconds}, "counters": {name: value}}."""
+    with _lock:
+        stages = {
+            name: {**h.summary(), "total": h.sum, "mean": h.sum / h.total if h.total else float('nan')}
+            for name, h in sorted(_histograms.items())
+        }
+        return {"stages": stages, "counters": dict(sorted(_counters.items()))}
+
+
+def _metric_name(name):
+    return f"{PREFIX}_{name}".replace(".", "_").replace("-", "_")
+
+
+def prometheus_text():
+    """The registry in the Prometheus text exposition format (version 0.0.4)."""
+    lines = []
+    with _lock:
+        for name, value in sorted(_counters.items()):
+            metric = _metric_name(name) + "_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, h in sorted(_histograms.items()):
+            metric = _metric_name(name) + "_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            # counts[i] holds samples in (edges[i-1], edges[i]]; the last bucket is above every edge
+            cumulative = 0
+            for edge, bucket in zip(h.edges, h.counts):
+                cumulative += int(bucket)
+                lines.append(f'{metric}_bucket{{le="{edge:.6g}"}} {cumulative}')
+            lines += [f'{metric}_bucket{{le="+Inf"}} {h.total}', f"{metric}_sum {h.sum:.9g}", f"{metric}_count {h.total}"]
+    return "\n".join(lines) + "\n"
+
+
+def write(path):
+    """Export to `path`: Prometheus text for .prom/.txt files, JSON otherwise."""
+    path = Path(path)
+    if path.suffix in (".prom", ".txt"):
+        path.write_text(prometheus_text())
+    else:
+        path.write_text(json.dumps(snapshot(), indent=2))
+    return path
+
+
+_server = None
+
+
+def serve(port=9108, host="127.0.0.1"):
+    """Serve /metrics from a daemon thread; later calls return the running server."""
+    global _server
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = prometheus_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # keep scrapes out of the Streamlit log
+            pass
+
+    with _lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), MetricsHandler)
+            threading.Thread(target=_server.serve_forever, name="bsgreeks-metrics", daemon=True).start()
+        return _server
@@ -0,0 +1,32 @@
+"""Standard normal CDF/PDF without the scipy.stats.norm dispatch layer.
+
+`norm.cdf` / `norm.pdf` validate arguments, handle loc/scale and build
+output masks on every call; for scalars and short arrays that overhead
+dwarfs the arithmetic. The pricer only ever needs the standard normal, so
+it calls the underlying routines directly. Arrays go through
+`scipy.special.ndtr`, the routine `norm.cdf` itself uses. Scalars go through
+`math.erfc`, so pricing a single contract never has to import SciPy.
+"""
+import math
+
+import numpy as np
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+_ndtr = None
+
+
+def norm_cdf(x):
+    """Standard normal cumulative distribution function N(x)."""
+    global _ndtr
+    if isinstance(x, float):  # also numpy.float64, which is what 0-d arithmetic yields
+        return 0.5 * math.erfc(-x * _INV_SQRT_2)
+    if _ndtr is None:
+        # Deferred: importing scipy.special costs far more than pricing a book
+        from scipy.special import ndtr as _ndtr
+    return _ndtr(x)
+
+
+def norm_pdf(x):
+    """Standard normal density N'(x)."""
+    return _INV_SQRT_2PI * np.exp(-0.5 * np.square(x))
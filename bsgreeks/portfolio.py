@@ -0,0 +1,187 @@
+"""Headless portfolio revaluation across a process pool.
+
+Reads a position file with columns S, K, T, r, sigma, type, quantity,
+splits it into chunks and prices them in parallel with
+`black_scholes_greeks_batch`. Each worker sends back only six
+quantity-weighted sums, so the result traffic is tiny however large the book is.
+With `--precision float32` the market inputs are loaded and priced in single
+precision, while quantities and the sums stay float64. A columnar store
+written by `bsgreeks.store` (a `.positions` directory) is memory-mapped
+instead of parsed. Each worker maps its own chunks of it.
+
+    python -m bsgreeks.portfolio positions.csv --workers 8 --stream
+    python -m bsgreeks.portfolio positions.csv --by underlying,expiry
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+from .batch import Greeks, black_scholes_greeks_batch, call_mask
+
+POSITION_COLUMNS = ("S", "K", "T", "r", "sigma", "type", "quantity")
+OPTIONAL_COLUMNS = ("underlying",)
+DEFAULT_CHUNK_SIZE = 250_000
+
+
+def read_positions(path, dtype=np.float64, exact=False):
+    """Load a CSV or Parquet position file into a dict of NumPy arrays.
+
+    S, K, T, r and sigma are stored as `dtype`; quantity is always float64.
+    `type` must be "call" or "put" (any case, surrounding spaces ignored);
+    other values raise ValueError naming the rows.
+    An optional "underlying" column becomes integer codes in "underlying", with
+    the sorted names in "underlying_labels".
+    pandas' fast CSV float parser can be off by a couple of ulps; `exact=True`
+    parses correctly rounded values instead, about 3x slower.
+
+    Parquet, and fast CSV parsing, need pandas (plus pyarrow for Parquet).
+    Without pandas, CSV files fall back to numpy.genfromtxt.
+    """
+    path = Path(path)
+    try:
+        import pandas as pd
+    except ImportError:
+        if path.suffix.lower() == '.parquet':
+            raise ImportError("Reading Parquet positions requires pandas and pyarrow") from None
+        raw = np.genfromtxt(path, delimiter=',', names=True, dtype=None, encoding='utf-8')
+        columns = {name: raw[name] for name in POSITION_COLUMNS + OPTIONAL_COLUMNS if name in raw.dtype.names}
+    else:
+        if path.suffix.lower() == '.parquet':
+            frame = pd.read_parquet(path)
+        else:
+            frame = pd.read_csv(path, float_precision='round_trip' if exact else None)
+        columns = {name: frame[name].to_numpy() for name in POSITION_COLUMNS + OPTIONAL_COLUMNS if name in frame}
+
+    positions = {name: np.ascontiguousarray(columns[name], dtype=dtype) for name in ("S", "K", "T", "r", "sigma")}
+    positions["is_call"] = _parse_types(columns["type"], path)
+    positions["quantity"] = np.ascontiguousarray(columns["quantity"], dtype=float)
+    if "underlying" in columns:
+        labels, codes = np.unique(columns["underlying"].astype(str), return_inverse=True)
+        positions["underlying"] = codes.astype(np.int32)
+        positions["underlying_labels"] = labels.tolist()
+    return positions
+
+
+def _parse_types(values, path, shown=10):
+    # Anything but call/put (a typo, an empty cell) would otherwise be priced silently as a put
+    labels = np.char.lower(np.char.strip(np.asarray(values).astype(str)))
+    bad = np.flatnonzero((labels != 'call') & (labels != 'put'))
+    if bad.size:
+        rows = ', '.join(f"{i + 1} ({str(values[i])!r})" for i in bad[:shown])
+        more = f" and {bad.size - shown} more" if bad.size > shown else ""
+        raise ValueError(f"{path}: type must be 'call' or 'put'; bad data row(s): {rows}{more}")
+    return call_mask(labels)
+
+
+def price_chunk(S, K, T, r, sigma, is_call, quantity, dtype=np.float64):
+    """Quantity-weighted sums of price and Greeks for one chunk of positions."""
+    greeks = black_scholes_greeks_batch(S, K, T, r, sigma, is_call, dtype=dtype)
+    # quantity is float64, so the dot product accumulates in float64 even for a float32 book
+    return np.array([np.dot(quantity, values) for values in greeks])
+
+
+def price_store_chunk(store, start, stop, dtype=np.float64):
+    """`price_chunk` for positions [start, stop) of a `PositionStore`."""
+    return price_chunk(**store.chunk(start, stop), dtype=dtype)
+
+
+def _chunks(positions, chunk_size):
+    # Yields (size, function, args) tasks
+    if not isinstance(positions, dict):
+        # A PositionStore pickles as its path, so the chunk data never goes through the pipe
+        for start, stop in positions.chunks(chunk_size):
+            yield stop - start, price_store_chunk, (positions, start, stop)
+        return
+    n = len(positions["S"])
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        yield stop - start, price_chunk, tuple(positions[name][start:stop] for name in
+                                               ("S", "K", "T", "r", "sigma", "is_call", "quantity"))
+
+
+def iter_revalue(positions, chunk_size=DEFAULT_CHUNK_SIZE, max_workers=None, dtype=np.float64):
+    """Yield (positions_done, running Greeks totals) as each chunk finishes.
+
+    `positions` is a dict of arrays, as from `read_positions`, or a `PositionStore`.
+    """
+    totals = np.zeros(len(Greeks._fields))
+    done = 0
+    # Workers are spawned rather than forked. A process that has run `fused_greeks` holds
+    # Numba's TBB thread pool, and with TBB a forked child keeps the parent from exiting.
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = {pool.submit(fn, *args, dtype=dtype): size
+                   for size, fn, args in _chunks(positions, chunk_size)}
+        for future in as_completed(futures):
+            totals += future.result()
+            done += futures[future]
+            yield done, Greeks(*totals.tolist())
+
+
+def revalue(positions, chunk_size=DEFAULT_CHUNK_SIZE, max_workers=None, dtype=np.float64):
+    """Portfolio-level price, delta, gamma, theta, vega and rho."""
+    totals = Greeks(*[0.0] * len(Greeks._fields))
+    for _, totals in iter_revalue(positions, chunk_size, max_workers, dtype):
+        pass
+    return totals
+
+
+def _format(totals):
+    return "  ".join(f"{name}={value:,.4f}" for name, value in totals._asdict().items())
+
+
+def _print_netted(aggregation, levels):
+    from .aggregate import QUANTITIES
+    labels, values, counts = aggregation.netted(*levels)
+    width = max([len(" / ".join(map(str, label))) for label in labels] + [len(" / ".join(levels))])
+    print(f"{' / '.join(levels):<{width}} {'positions':>10} " + " ".join(f"{name:>14}" for name in QUANTITIES))
+    for label, row, count in zip(labels, values, counts):
+        print(f"{' / '.join(map(str, label)):<{width}} {count:>10,} " + " ".join(f"{value:>14,.2f}" for value in row))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Revalue a book of European options in parallel.")
+    parser.add_argument("positions", help="CSV or Parquet file with columns " + ", ".join(POSITION_COLUMNS)
+                        + ", or a .positions store")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--stream", action="store_true", help="print running totals as chunks complete")
+    parser.add_argument("--precision", choices=("float64", "float32"), default="float64",
+                        help="precision of the pricing math; totals are always accumulated in float64")
+    parser.add_argument("--by", help="net the totals by a comma-separated subset of underlying, expiry, strike "
+                                     "(priced in this process)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if Path(args.positions).suffix == ".positions":
+        from .store import PositionStore
+        positions = PositionStore.open(args.positions)
+    else:
+        positions = read_positions(args.positions, dtype=args.precision)
+    loaded = time.perf_counter()
+    n = len(positions["S"])
+
+    if args.by:
+        from .aggregate import BookAggregation
+        _print_netted(BookAggregation(positions, dtype=args.precision), args.by.split(","))
+        print(f"positions: {n:,}  load: {loaded - start:.2f} s  aggregation: {time.perf_counter() - loaded:.2f} s")
+        return
+
+    totals = None
+    for done, totals in iter_revalue(positions, args.chunk_size, args.workers, args.precision):
+        if args.stream:
+            print(f"[{done:>{len(str(n))}}/{n}] {_format(totals)}")
+    finished = time.perf_counter()
+
+    print(f"positions: {n:,}  load: {loaded - start:.2f} s  "
+          f"pricing: {finished - loaded:.2f} s ({n / max(finished - loaded, 1e-9):,.0f} positions/s)")
+    if totals is not None:
+        print(_format(totals))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Greek-curve rendering for the Interactive Tool.
+
+Building a new pyplot figure on every Streamlit rerun is slow, and figures
+that are never closed stay in pyplot's registry, so memory grows with each
+interaction. This module keeps one `Figure` per process, created through
+the object-oriented API so pyplot never tracks it, and reuses its `Line2D`
+objects. Each render only swaps the line data and labels. The encoded
+PNG/SVG bytes are cached on the inputs, so a repeated view never reaches
+matplotlib at all.
+"""
+import io
+import threading
+from functools import lru_cache
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from .cache import CACHE_SIZE, cached_greek_curves, quantize
+from .metrics import count, stage
+from .surfaces import SURFACES, _surface, surface_key
+
+GREEK_SCALE = {"Delta": 1.0, "Gamma": 1.0, "Theta": 1.0 / 365, "Vega": 1.0, "Rho": 1.0}  # Theta shown per day
+INPUT_LABELS = {"S": "Stock Price (S)", "K": "Strike Price (K)", "T": "Time to Maturity (years)", "sigma": "Volatility (σ)"}
+
+
+class CurveFigure:
+    """One reusable figure: a Greek curve plus a marker at the current spot."""
+
+    def __init__(self, figsize=(10, 5), dpi=100):
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.ax = self.figure.subplots()
+        (self.curve,) = self.ax.plot([], [], color='darkorange', linewidth=2)
+        self.spot = self.ax.axvline(0.0, color='red', linestyle='--', label='Current Stock Price (S)')
+        self.ax.set_xlabel("Stock Price (S)")
+        self.ax.grid(alpha=0.3)
+        self.ax.legend()
+        self._lock = threading.Lock()
+
+    def render(self, x, y, spot, greek, fmt='png'):
+        # The figure is shared by all sessions; serialize the update-and-encode step
+        with self._lock:
+            with stage("render.figure"):
+                self.curve.set_data(x, y)
+                self.spot.set_xdata([spot, spot])
+                self.ax.set_title(f"{greek} vs Stock Price", fontweight='bold')
+                self.ax.set_ylabel(greek)
+                self.ax.relim()
+                self.ax.autoscale_view()
+            return _encode(self.figure, fmt)
+
+
+def _encode(figure, fmt):
+    with stage("render.encode"):
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format=fmt)
+        return buffer.getvalue()
+
+
+_figure = None
+_figure_lock = threading.Lock()
+
+
+def _shared_figure():
+    global _figure
+    with _figure_lock:
+        if _figure is None:
+            _figure = CurveFigure()
+        return _figure
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _chart(greek, S, K, T, r, sigma, option_type, n_points, fmt):
+    count("cache.charts.miss")
+    S_range, curve = cached_greek_curves(50.0, 150.0, n_points, K, T, r, sigma, option_type)
+    return _shared_figure().render(S_range, getattr(curve, greek.lower()) * GREEK_SCALE[greek], S, greek, fmt)
+
+
+def greek_chart(greek, S, K, T, r, sigma, option_type='call', n_points=1000, fmt='png'):
+    """Encoded chart of `greek` against S over [50, 150], cached on its inputs."""
+    count("cache.charts.lookup")
+    return _chart(greek, *map(quantize, (S, K, T, r, sigma)), option_type, int(n_points), fmt)
+
+
+def greek_chart_data(greek, K, T, r, sigma, option_type='call', n_points=1000):
+    """Numeric arrays for a client-side chart: {"S": S_range, greek: values}."""
+    S_range, curve = cached_greek_curves(50.0, 150.0, n_points, K, T, r, sigma, option_type)
+    return {"Stock Price (S)": S_range, greek: getattr(curve, greek.lower()) * GREEK_SCALE[greek]}
+
+
+def heatmap(x, y, plane, xlabel, ylabel, title, cmap='RdYlGn', figsize=(10, 5), dpi=100, fmt='png'):
+    """Encoded heatmap of `plane` (rows along y, columns along x) on a throwaway figure."""
+    with stage("render.figure"):
+        figure = Figure(figsize=figsize, dpi=dpi)
+        ax = figure.subplots()
+        mesh = ax.pcolormesh(x, y, plane, cmap=cmap, shading='nearest')
+        figure.colorbar(mesh, ax=ax)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title, fontweight='bold')
+    return _encode(figure, fmt)
+
+
+def surface_3d(x, y, z, xlabel, ylabel, zlabel, title, max_facets=100, figsize=(10, 6), dpi=100, fmt='png'):
+    """Encoded 3D surface plot; matplotlib draws at most `max_facets` facets per side."""
+    with stage("render.figure"):
+        figure = Figure(figsize=figsize, dpi=dpi)
+        ax = figure.add_subplot(projection='3d')
+        X, Y = np.meshgrid(x, y)
+        ax.plot_surface(X, Y, z, cmap='viridis', linewidth=0,
+                        rcount=min(len(y), max_facets), ccount=min(len(x), max_facets))
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_zlabel(zlabel)
+        ax.set_title(title, fontweight='bold')
+    return _encode(figure, fmt)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _surface_image(kind, greek, style, n, key, option_type, fmt):
+    x, y, surface = _surface(kind, n, *key, option_type == 'call')
+    z = getattr(surface, greek.lower()) * GREEK_SCALE[greek]
+    x_name, y_name, _, _ = SURFACES[kind]
+    title = f"{greek} vs {x_name} and {y_name}".replace("sigma", "σ")
+    if style == "3D":
+        return surface_3d(x, y, z, INPUT_LABELS[x_name], INPUT_LABELS[y_name], greek, title, fmt=fmt)
+    return heatmap(x, y, z, INPUT_LABELS[x_name], INPUT_LABELS[y_name], title, cmap='viridis', fmt=fmt)
+
+
+def surface_image(kind, greek, style, n, S, K, T, r, sigma, option_type='call', fmt='png'):
+    """Encoded heatmap (style "Heatmap") or 3D plot (style "3D") of a Greek surface, cached."""
+    return _surface_image(kind, greek, style, int(n), surface_key(kind, S, K, T, r, sigma), option_type, fmt)
+
+
+def chart_cache_info():
+    return _chart.cache_info()._asdict()
+
+
+def surface_cache_info():
+    return _surface_image.cache_info()._asdict()
@@ -0,0 +1,106 @@
+"""Scenario grids: P&L and Greek cubes over the Cartesian product of shocks.
+
+Spot shocks are relative (S * (1 + shock)), vol shocks and rate shifts are
+absolute, and time steps are years of decay subtracted from T. Every
+scenario/position pair is priced in one broadcasted call. Positions sit on
+the last axis, so the quantity-weighted sum is a single matmul.
+
+The broadcast holds n_scenarios * n_positions elements. To keep memory
+bounded, positions are processed in chunks sized so that each chunk stays
+under `max_elements`, and the results are summed. A grid that alone holds
+more than `max_elements` scenarios is also split into blocks along its
+outermost axes, so memory stays bounded however many shocks are asked for.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from .batch import Greeks, black_scholes_greeks_batch
+
+AXES = ("spot", "vol", "rate", "time")
+QUANTITIES = ("pnl",) + Greeks._fields
+DEFAULT_MAX_ELEMENTS = 4_000_000
+
+
+class StressCube(NamedTuple):
+    axes: dict            # axis name -> shock values, in AXES order
+    values: dict          # quantity name -> array of shape (n_spot, n_vol, n_rate, n_time)
+
+    def slice2d(self, quantity, x, y, at=None):
+        """2D slice (rows = y axis, columns = x axis) with the other axes fixed.
+
+        `at` maps the remaining axis names to indices; by default each is
+        fixed at the shock closest to zero.
+        """
+        at = dict(at or {})
+        index = []
+        for name in AXES:
+            if name in (x, y):
+                index.append(slice(None))
+            else:
+                index.append(at.get(name, int(np.argmin(np.abs(self.axes[name])))))
+        plane = self.values[quantity][tuple(index)]
+        return plane.T if AXES.index(x) < AXES.index(y) else plane
+
+
+def _scenario_blocks(shape, max_elements):
+    """Yield index tuples of slices covering `shape`, each holding at most `max_elements` scenarios.
+
+    Axes are split from the outermost in, so a grid that fits is a single
+    block, and a block is never smaller than one scenario.
+    """
+    for split in range(len(shape)):
+        inner = int(np.prod(shape[split + 1:]))
+        if inner <= max_elements:
+            break
+    step = max(1, max_elements // inner)
+    rest = (slice(None),) * (len(shape) - split - 1)
+    for outer in np.ndindex(*shape[:split]):
+        for start in range(0, shape[split], step):
+            yield tuple(slice(i, i + 1) for i in outer) + (slice(start, start + step),) + rest
+
+
+def _position_chunks(positions, size):
+    """Yield (columns, quantity) for consecutive slices of at most `size` positions."""
+    for start in range(0, len(positions["S"]), size):
+        part = {name: np.asarray(values)[start:start + size] for name, values in positions.items()}
+        yield part, np.asarray(part["quantity"], dtype=float)
+
+
+def stress_cube(positions, spot_shocks=(0.0,), vol_shocks=(0.0,), rate_shifts=(0.0,), time_steps=(0.0,),
+                max_elements=DEFAULT_MAX_ELEMENTS):
+    """Portfolio P&L and Greek totals for every combination of shocks.
+
+    `positions` is a dict of arrays with keys S, K, T, r, sigma, is_call and
+    quantity, as returned by `bsgreeks.portfolio.read_positions`.
+    """
+    axes = dict(zip(AXES, (np.atleast_1d(np.asarray(a, dtype=float)) for a in
+                           (spot_shocks, vol_shocks, rate_shifts, time_steps))))
+    shape = tuple(a.size for a in axes.values())
+    # One singleton position axis at the end of every shock axis
+    shocks = [a.reshape([-1 if i == k else 1 for i in range(4)] + [1]) for k, a in enumerate(axes.values())]
+
+    totals = np.zeros((len(Greeks._fields),) + shape)
+    for block in _scenario_blocks(shape, max_elements):
+        ds, dv, dr, dt = (a[(slice(None),) * k + (block[k],)] for k, a in enumerate(shocks))
+        chunk = max(1, max_elements // (ds.size * dv.size * dr.size * dt.size))
+        for part, quantity in _position_chunks(positions, chunk):
+            greeks = black_scholes_greeks_batch(
+                part["S"] * (1.0 + ds),
+                part["K"],
+                # Decay past expiry and vol shocks below zero stop at 0, where the pricer takes its limits
+                np.maximum(part["T"] - dt, 0.0),
+                part["r"] + dr,
+                np.maximum(part["sigma"] + dv, 0.0),
+                part["is_call"],
+            )
+            totals[(slice(None),) + block] += np.stack([np.asarray(values) @ quantity for values in greeks])
+    base_value = sum(
+        black_scholes_greeks_batch(part["S"], part["K"], part["T"], part["r"], part["sigma"], part["is_call"]).price
+        @ quantity
+        for part, quantity in _position_chunks(positions, max(1, max_elements))
+    )
+
+    values = {"pnl": totals[0] - base_value}
+    values.update(zip(Greeks._fields, totals))
+    return StressCube(axes, values)
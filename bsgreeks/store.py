@@ -0,0 +1,189 @@
+"""Columnar position store: a book on disk that opens without copying.
+
+A store is a directory holding one `.npy` file per column, plus a small
+`meta.json`:
+
+    book.positions/
+        S.npy K.npy T.npy r.npy sigma.npy   contiguous float64 or float32
+        quantity.npy                        float64
+        is_call.npy                         uint8, 8 contracts per byte (np.packbits, little bit order)
+        underlying.npy                      int32 codes, optional
+        meta.json                           {"rows": n, "dtype": "float64", "version": 1,
+                                             "underlying_labels": [...] if underlying.npy exists}
+
+`PositionStore.open` memory-maps every column. Opening a 10M-row book
+therefore reads only the file headers, and pages are loaded as the pricer
+touches them. `chunk(start, stop)` returns a dict that can be passed straight
+to `portfolio.price_chunk`, and `market_chunk(start, stop)` the same dict
+without quantity, for `black_scholes_greeks_batch`. The market columns
+are views into the maps. Only the call/put flags are unpacked, one byte per
+row of the chunk. Chunks leave out the underlying codes, which are
+`store["underlying"]` (with `store["underlying_labels"]`). A store pickles
+as its path, so process-pool workers reopen it instead of receiving a copy
+of the data.
+
+    python -m bsgreeks.store positions.csv book.positions --precision float32
+    python -m bsgreeks.store book.positions positions.csv
+"""
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .portfolio import POSITION_COLUMNS, read_positions
+
+STORE_SUFFIX = ".positions"
+FORMAT_VERSION = 1
+MARKET_COLUMNS = ("S", "K", "T", "r", "sigma")
+
+
+def _unpack(bits, start, stop):
+    # Unpack just the bytes covering [start, stop), then drop the bits outside it
+    first = start // 8
+    flags = np.unpackbits(bits[first:(stop + 7) // 8], bitorder='little')
+    return flags[start - 8 * first:stop - 8 * first].view(bool)
+
+
+def write_store(path, positions, dtype=None):
+    """Write a dict of position arrays (as from `read_positions`) to a store directory.
+
+    `dtype` defaults to the dtype of `positions["S"]`; quantity is always float64.
+    """
+    path = Path(path)
+    dtype = np.dtype(dtype or np.asarray(positions["S"]).dtype)
+    n = len(positions["S"])
+    path.mkdir(parents=True, exist_ok=True)
+    for name in MARKET_COLUMNS:
+        np.save(path / f"{name}.npy", np.ascontiguousarray(positions[name], dtype=dtype))
+    np.save(path / "quantity.npy", np.ascontiguousarray(positions["quantity"], dtype=np.float64))
+    np.save(path / "is_call.npy", np.packbits(np.asarray(positions["is_call"], dtype=bool), bitorder='little'))
+    meta = {"rows": n, "dtype": dtype.name, "version": FORMAT_VERSION}
+    if "underlying" in positions:
+        np.save(path / "underlying.npy", np.ascontiguousarray(positions["underlying"], dtype=np.int32))
+        meta["underlying_labels"] = list(positions["underlying_labels"])
+    (path / "meta.json").write_text(json.dumps(meta, indent=2))
+    return PositionStore.open(path)
+
+
+class PositionStore:
+    """A memory-mapped position store; see the module docstring for the layout."""
+
+    def __init__(self, path, columns, bits, rows, underlying=None, underlying_labels=None):
+        self.path = Path(path)
+        self.columns = columns
+        self.bits = bits
+        self.rows = rows
+        self.dtype = columns["S"].dtype
+        self.underlying = underlying
+        self.underlying_labels = underlying_labels
+
+    @classmethod
+    def open(cls, path, mmap_mode='r'):
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text())
+        if meta["version"] != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported position store version {meta['version']}")
+        columns = {name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode)
+                   for name in (*MARKET_COLUMNS, "quantity")}
+        underlying = None
+        if "underlying_labels" in meta:
+            underlying = np.load(path / "underlying.npy", mmap_mode=mmap_mode)
+        return cls(path, columns, np.load(path / "is_call.npy", mmap_mode=mmap_mode), meta["rows"],
+                   underlying, meta.get("underlying_labels"))
+
+    def __reduce__(self):
+        return PositionStore.open, (self.path,)
+
+    def __len__(self):
+        return self.rows
+
+    def __contains__(self, name):
+        if name in ("underlying", "underlying_labels"):
+            return self.underlying is not None
+        return name == "is_call" or name in self.columns
+
+    def __getitem__(self, name):
+        """A whole column; "is_call" is unpacked, the others are the memory maps themselves."""
+        if name == "is_call":
+            return _unpack(self.bits, 0, self.rows)
+        if name in ("underlying", "underlying_labels") and name in self:
+            return getattr(self, name)
+        return self.columns[name]
+
+    def chunk(self, start, stop):
+        """Positions [start, stop) as S, K, T, r, sigma, is_call and quantity arrays."""
+        start, stop, _ = slice(start, stop).indices(self.rows)
+        out = self.market_chunk(start, stop)
+        out["quantity"] = self.columns["quantity"][start:stop]
+        return out
+
+    def market_chunk(self, start, stop):
+        """Positions [start, stop) as S, K, T, r, sigma and is_call arrays, the pricer's arguments."""
+        start, stop, _ = slice(start, stop).indices(self.rows)
+        out = {name: self.columns[name][start:stop] for name in MARKET_COLUMNS}
+        out["is_call"] = _unpack(self.bits, start, stop)
+        return out
+
+    def chunks(self, chunk_size):
+        """Yield (start, stop) bounds that cover the store in order."""
+        for start in range(0, self.rows, chunk_size):
+            yield start, min(start + chunk_size, self.rows)
+
+
+def csv_to_store(csv_path, store_path, dtype=np.float64):
+    """Convert a CSV or Parquet position file (columns as in `read_positions`) to a store.
+
+    CSV floats are parsed exactly, so `store_to_csv` followed by this reproduces the store.
+    """
+    return write_store(store_path, read_positions(csv_path, dtype=dtype, exact=True), dtype)
+
+
+def store_to_csv(store, csv_path, chunk_size=1_000_000):
+    """Write a store, or a store path, back to CSV with columns S, K, T, r, sigma, type, quantity.
+
+    Stores with underlying codes get an extra "underlying" column of their names.
+    """
+    if not isinstance(store, PositionStore):
+        store = PositionStore.open(store)
+    # 9 significant digits round-trip float32, 17 round-trip float64
+    digits = 9 if store.dtype == np.float32 else 17
+    fmt = [f"%.{digits}g"] * len(MARKET_COLUMNS) + ["%s", "%.17g"]
+    fields = [*((name, store.dtype) for name in MARKET_COLUMNS), ("type", "U4"), ("quantity", np.float64)]
+    header = list(POSITION_COLUMNS)
+    if "underlying" in store:
+        labels = np.asarray(store.underlying_labels, dtype=str)
+        fields.append(("underlying", labels.dtype))
+        header.append("underlying")
+        fmt.append("%s")
+    with open(csv_path, "w") as f:
+        f.write(",".join(header) + "\n")
+        for start, stop in store.chunks(chunk_size):
+            chunk = store.chunk(start, stop)
+            rows = np.empty(stop - start, dtype=fields)
+            for name in (*MARKET_COLUMNS, "quantity"):
+                rows[name] = chunk[name]
+            rows["type"] = np.where(chunk["is_call"], "call", "put")
+            if "underlying" in store:
+                rows["underlying"] = labels[store.underlying[start:stop]]
+            np.savetxt(f, rows, fmt=fmt, delimiter=",")
+    return Path(csv_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert position files to and from the columnar store.")
+    parser.add_argument("source", help=f"CSV or Parquet file, or a {STORE_SUFFIX} store")
+    parser.add_argument("target", help=f"{STORE_SUFFIX} store, or a CSV file when the source is a store")
+    parser.add_argument("--precision", choices=("float64", "float32"), default="float64",
+                        help="dtype of the market columns in a new store")
+    args = parser.parse_args(argv)
+
+    if Path(args.source).suffix == STORE_SUFFIX:
+        store_to_csv(args.source, args.target)
+    else:
+        store = csv_to_store(args.source, args.target, args.precision)
+        print(f"{len(store):,} positions written to {store.path}")
+
+
+if __name__ == "__main__":
+    main()
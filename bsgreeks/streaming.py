@@ -0,0 +1,198 @@
+"""Tick-driven revaluation of a fixed book on one underlying.
+
+`PrecomputedBook` folds everything that does not depend on spot into
+per-contract weight vectors once: ln K, K e^{-rT}, e^{-qT}, sigma sqrt(T),
+the drift term, the call/put sign and the position size. On each tick the only work
+left is d1/d2, two CDFs, one PDF and six dot products.
+
+Two drivers are provided. `tick_greeks` is a plain generator. `stream_greeks`
+is an async generator: a bounded queue sits between it and the tick source.
+If the pricer falls behind, the default policy conflates ticks. It drops
+stale prices and revalues the latest one, because a risk view wants the
+newest spot rather than a backlog. Memory stays bounded either way, and
+per-tick latency goes into a fixed-size histogram.
+"""
+import asyncio
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from .batch import LIMIT_D, MIN_SIG_SQRT_T, Greeks
+# LatencyHistogram used to live here; it is still importable from this module
+from .metrics import LatencyHistogram  # noqa: F401
+from .normal import norm_cdf, norm_pdf
+
+
+class TickGreeks(NamedTuple):
+    spot: float
+    greeks: Greeks    # quantity-weighted book totals
+    latency: float    # seconds from receipt of the tick to its result
+
+
+class PrecomputedBook:
+    """Spot-independent terms of a book, ready for repeated revaluation.
+
+    `q` is the continuous carry of `black_scholes_greeks_batch`. Rows at
+    expiry or with zero vol get the same limits as there (see `batch._d1_d2`):
+    their divisors are replaced by 1 up front, and on each tick d1 = d2 =
+    +/-LIMIT_D by the side of the forward that spot puts them on.
+    """
+
+    def __init__(self, K, T, r, sigma, is_call=True, quantity=1.0, q=0.0):
+        K, T, r, sigma, is_call, quantity, q = np.broadcast_arrays(
+            np.asarray(K, dtype=float), np.asarray(T, dtype=float),
+            np.asarray(r, dtype=float), np.asarray(sigma, dtype=float),
+            np.asarray(is_call, dtype=bool), np.asarray(quantity, dtype=float),
+            np.asarray(q, dtype=float),
+        )
+        K, T, r, sigma, is_call, quantity, q = (a.ravel() for a in (K, T, r, sigma, is_call, quantity, q))
+        sqrt_T = np.sqrt(T)
+        sig_sqrt_T = sigma * sqrt_T
+        degenerate = sig_sqrt_T < MIN_SIG_SQRT_T
+        self.degenerate = degenerate if degenerate.any() else None
+        if self.degenerate is not None:
+            sqrt_T = np.where(degenerate, 1.0, sqrt_T)
+            sig_sqrt_T = np.where(degenerate, 1.0, sig_sqrt_T)
+        K_df = K * np.exp(-r * T)
+        q_df = np.exp(-q * T)
+        self.w = np.where(is_call, 1.0, -1.0)
+        qw = quantity * self.w
+
+        # ln S minus this is ln(F/K) + sigma^2 T / 2, whose sign also places degenerate rows
+        self.log_K_minus_drift = np.log(K) - (r - q + 0.5 * sigma**2) * T
+        self.sig_sqrt_T = sig_sqrt_T
+        # Weights for the dot products that turn N(w d1), N(w d2), N'(d1) into book totals
+        self.qw = qw * q_df
+        self.qw_K_df = qw * K_df
+        self.q_over_sig_sqrt_T = quantity * q_df / sig_sqrt_T
+        self.q_sqrt_T = quantity * q_df * sqrt_T
+        self.q_sigma_over_2sqrt_T = quantity * q_df * sigma / (2 * sqrt_T)
+        self.qw_r_K_df = qw * r * K_df
+        self.qw_T_K_df = qw * T * K_df
+        # Carry term of theta, w q S e^{-qT} N(w d1); skipped when q is zero everywhere
+        self.qw_q = self.qw * q if np.any(q) else None
+
+    @classmethod
+    def from_positions(cls, positions):
+        """Build from the dict returned by `bsgreeks.portfolio.read_positions` (S is ignored)."""
+        return cls(positions["K"], positions["T"], positions["r"], positions["sigma"],
+                   positions["is_call"], positions["quantity"], positions.get("q", 0.0))
+
+    def __len__(self):
+        return self.w.size
+
+    def aggregate(self, S):
+        """Book totals of price and Greeks at spot S."""
+        x = np.log(S) - self.log_K_minus_drift
+        d1 = x / self.sig_sqrt_T
+        d2 = d1 - self.sig_sqrt_T
+        if self.degenerate is not None:
+            step = LIMIT_D * np.sign(x)
+            d1 = np.where(self.degenerate, step, d1)
+            d2 = np.where(self.degenerate, step, d2)
+        N1 = norm_cdf(self.w * d1)
+        N2 = norm_cdf(self.w * d2)
+        n1 = norm_pdf(d1)
+        if self.degenerate is not None:
+            n1 = np.where(self.degenerate, 0.0, n1)
+
+        sum_qw_N1 = self.qw @ N1
+        sum_K_N2 = self.qw_K_df @ N2
+        theta = -S * (self.q_sigma_over_2sqrt_T @ n1) - self.qw_r_K_df @ N2
+        if self.qw_q is not None:
+            theta += S * (self.qw_q @ N1)
+        return Greeks(
+            price=float(S * sum_qw_N1 - sum_K_N2),
+            delta=float(sum_qw_N1),
+            gamma=float(self.q_over_sig_sqrt_T @ n1 / S),
+            theta=float(theta),
+            vega=float(S * (self.q_sqrt_T @ n1)),
+            rho=float(self.qw_T_K_df @ N2),
+        )
+
+
+def tick_greeks(book, spots, histogram=None):
+    """Synchronously revalue `book` for every spot in `spots`."""
+    for S in spots:
+        start = time.perf_counter()
+        greeks = book.aggregate(float(S))
+        latency = time.perf_counter() - start
+        if histogram is not None:
+            histogram.record(latency)
+        yield TickGreeks(float(S), greeks, latency)
+
+
+class _SourceError(NamedTuple):
+    """Queue sentinel carrying the exception that ended the tick source."""
+    exc: Exception
+
+
+async def stream_greeks(book, source, max_pending=1, conflate=True, histogram=None, stats=None):
+    """Revalue `book` for each spot from the async iterable `source`.
+
+    At most `max_pending` ticks wait in the queue. When it is full, either the
+    oldest pending tick is dropped (`conflate=True`) or the source is paused
+    until the pricer catches up. Dropped ticks are counted in `stats["dropped"]`.
+    An exception raised by `source` is re-raised here once the ticks queued
+    before it have been revalued.
+    """
+    queue = asyncio.Queue(maxsize=max_pending)
+    stats = {} if stats is None else stats
+    stats.setdefault("dropped", 0)
+    done = object()
+
+    async def produce():
+        try:
+            async for S in source:
+                item = (float(S), time.perf_counter())
+                if conflate and queue.full():
+                    queue.get_nowait()
+                    stats["dropped"] += 1
+                await queue.put(item)
+        except Exception as exc:
+            # Hand the failure to the consumer, which would otherwise wait on the queue forever
+            await queue.put(_SourceError(exc))
+        else:
+            await queue.put(done)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            if isinstance(item, _SourceError):
+                raise item.exc
+            S, received = item
+            greeks = book.aggregate(S)
+            latency = time.perf_counter() - received
+            if histogram is not None:
+                histogram.record(latency)
+            yield TickGreeks(S, greeks, latency)
+            # Give the producer a turn so it can enqueue (or conflate) new ticks
+            await asyncio.sleep(0)
+    finally:
+        producer.cancel()
+
+
+async def replay_file(path, interval=0.0):
+    """Replay spots from a text file (one price per line, or `timestamp,price`)."""
+    with open(path) as fh:
+        for line in fh:
+            line = line.strip()
+            if not line or line[0].isalpha():
+                continue
+            yield float(line.rsplit(',', 1)[-1])
+            await asyncio.sleep(interval)
+
+
+async def read_socket(host, port):
+    """Read newline-delimited spot prices from a TCP socket until it closes."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while line := await reader.readline():
+            yield float(line.decode().rsplit(',', 1)[-1])
+    finally:
+        writer.close()
+        await writer.wait_closed()
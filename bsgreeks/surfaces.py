@@ -0,0 +1,85 @@
+"""Greek surfaces over two model inputs, evaluated in one broadcasted call.
+
+A surface varies two inputs over a 2D grid and holds the rest at the
+current slider values: spot and maturity (S, T), or strike and volatility
+(K, sigma). All six quantities of a surface come out of a single
+`black_scholes_greeks_batch` call. They are cached together, like the
+curves in `bsgreeks.cache`.
+
+`ResolutionController` picks the grid size. It keeps the interface inside
+a latency budget and then refines step by step while the user leaves the
+inputs alone.
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from .batch import black_scholes_greeks_batch
+from .cache import _freeze, quantize
+
+# kind -> (x input, y input, x range, y range)
+SURFACES = {
+    "S-T": ("S", "T", (50.0, 150.0), (0.1, 5.0)),
+    "K-sigma": ("K", "sigma", (50.0, 150.0), (0.1, 1.0)),
+}
+
+
+@lru_cache(maxsize=64)
+def _surface(kind, n, S, K, T, r, sigma, is_call):
+    x_name, y_name, x_range, y_range = SURFACES[kind]
+    x, y = np.linspace(*x_range, n), np.linspace(*y_range, n)
+    for axis in (x, y):
+        axis.flags.writeable = False
+    inputs = {"S": S, "K": K, "T": T, "r": r, "sigma": sigma}
+    inputs[x_name], inputs[y_name] = x[None, :], y[:, None]
+    return x, y, _freeze(black_scholes_greeks_batch(**inputs, is_call=is_call))
+
+
+def surface_key(kind, S, K, T, r, sigma):
+    """Quantized (S, K, T, r, sigma) with the two varied inputs blanked out.
+
+    The varied inputs do not change the surface, so they are kept out of
+    every cache key built on it.
+    """
+    x_name, y_name, _, _ = SURFACES[kind]
+    inputs = {name: quantize(value) for name, value in zip(("S", "K", "T", "r", "sigma"), (S, K, T, r, sigma))}
+    inputs[x_name] = inputs[y_name] = None
+    return tuple(inputs.values())
+
+
+def greek_surface(kind, n, S, K, T, r, sigma, option_type='call'):
+    """(x, y, Greeks) on an n x n grid; Greeks arrays have shape (len(y), len(x))."""
+    return _surface(kind, int(n), *surface_key(kind, S, K, T, r, sigma), option_type == 'call')
+
+
+class ResolutionController:
+    """Chooses grid sizes that fit a per-render latency budget.
+
+    It keeps a running estimate of seconds per grid point and picks the largest
+    n with n**2 * cost <= budget. `refinement_steps` then doubles the resolution
+    up to `max_n`, so a caller can show a coarse surface at once and sharpen it
+    while nothing changes.
+    """
+
+    def __init__(self, budget_s=0.25, min_n=20, max_n=400, cost_per_point=1e-5, smoothing=0.5):
+        self.budget_s = budget_s
+        self.min_n = min_n
+        self.max_n = max_n
+        self.cost_per_point = cost_per_point
+        self.smoothing = smoothing
+
+    def resolution(self):
+        n = int(math.sqrt(self.budget_s / self.cost_per_point))
+        return max(self.min_n, min(self.max_n, n))
+
+    def observe(self, n, elapsed_s):
+        cost = elapsed_s / (n * n)
+        self.cost_per_point += self.smoothing * (cost - self.cost_per_point)
+
+    def refinement_steps(self):
+        n = self.resolution()
+        yield n
+        while n < self.max_n:
+            n = min(2 * n, self.max_n)
+            yield n
@@ -0,0 +1,216 @@
+"""Shared compute workers for a Streamlit server with many concurrent sessions.
+
+By default every session prices and renders in its own script thread. The
+module-level caches are shared, but a miss is computed by whichever
+session hits it. Matplotlib holds the GIL while it draws, so the server
+uses about one core and rerun latency grows with the number of users.
+
+With `BSGREEKS_WORKERS=N streamlit run ...`, or `start(N)`, the app sends
+its chart and surface requests through `compute`/`submit` to one process
+pool shared by all sessions. Requests are keyed by function and
+arguments. A request identical to one in flight gets the same future, so
+five analysts opening the same lab wait on one render. Finished results
+stay in a bounded LRU in the server process, so a repeated view never
+crosses the process boundary. Failed calls are not kept.
+
+Without a pool, `compute(fn, *args)` is just `fn(*args)`. Workers keep
+their own copies of the `bsgreeks` caches and metrics registry. Stages
+timed inside a worker are therefore not in the server's profiling panel.
+
+If a worker dies (killed, out of memory), the executor is broken for good.
+The next `submit` replaces it with a fresh pool. A call that was running
+when it broke is computed in the server process instead by `compute` and
+`result`.
+"""
+import multiprocessing
+import os
+import sys
+import threading
+import types
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from .cache import CACHE_SIZE
+from .metrics import count
+
+
+def _warm():
+    # Pay for the matplotlib import when the worker starts, not on the first chart
+    from . import render  # noqa: F401
+
+
+# Held while __main__ is swapped out, so two pools never start at once
+_main_lock = threading.Lock()
+_START_ATTEMPTS = 3
+
+
+def _start_executor(max_workers):
+    """A spawn-context executor with all `max_workers` processes already running.
+
+    A spawned child re-runs the parent's __main__ module. Under Streamlit that
+    is the app script, which would draw the whole page in every worker. The
+    executor starts one process per submit while none is idle, so every
+    process is started with __main__ hidden. Streamlit installs its own
+    __main__ at the start of every script run, from any session's thread.
+    If that happens while the workers start, some of them may have seen the
+    app script, so that pool is discarded and started again.
+    """
+    hidden = types.ModuleType("__main__")
+    for _ in range(_START_ATTEMPTS):
+        executor = ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_warm)
+        with _main_lock:
+            main = sys.modules["__main__"]
+            sys.modules["__main__"] = hidden
+            try:
+                ready = [executor.submit(os.getpid) for _ in range(max_workers)]
+            finally:
+                # Put back what we took, unless a script run has installed its own meanwhile
+                clean = sys.modules["__main__"] is hidden
+                if clean:
+                    sys.modules["__main__"] = main
+        if clean:
+            for future in ready:
+                future.result()
+            return executor
+        executor.shutdown(wait=False, cancel_futures=True)
+    raise RuntimeError(f"__main__ changed while worker processes started, {_START_ATTEMPTS} times in a row")
+
+
+def _hashable(arg):
+    if isinstance(arg, np.ndarray):
+        return (arg.shape, arg.dtype.str, arg.tobytes())
+    if isinstance(arg, (list, tuple)):
+        return tuple(_hashable(item) for item in arg)
+    return arg
+
+
+class WorkerPool:
+    """A process pool that merges identical in-flight requests and remembers results.
+
+    `fn` must be picklable, i.e. a module-level function, and its arguments
+    must be hashable or NumPy arrays. Worker processes are spawned rather
+    than forked, because forking a multi-threaded server can deadlock the
+    child. All of them are started by the constructor, which returns once
+    they are ready (see `_start_executor`).
+    """
+
+    def __init__(self, max_workers=None, cache_size=CACHE_SIZE):
+        self.max_workers = max_workers or os.cpu_count()
+        self.cache_size = cache_size
+        self._executor = _start_executor(self.max_workers)
+        self._lock = threading.Lock()
+        self._futures = OrderedDict()
+        self._stats = {"requests": 0, "submitted": 0, "coalesced": 0, "cached": 0, "restarts": 0}
+
+    def submit(self, fn, *args):
+        key = (fn.__module__, fn.__qualname__, _hashable(args))
+        with self._lock:
+            self._stats["requests"] += 1
+            future = self._futures.get(key)
+            if future is not None:
+                self._futures.move_to_end(key)
+                outcome = "cached" if future.done() else "coalesced"
+                self._stats[outcome] += 1
+                count(f"workers.{outcome}")
+                return future
+            try:
+                future = self._executor.submit(fn, *args)
+            except BrokenProcessPool:
+                self._restart()
+                future = self._executor.submit(fn, *args)
+            self._futures[key] = future
+            self._stats["submitted"] += 1
+            count("workers.submitted")
+            # Evict the oldest finished results; a request still in flight is never dropped
+            while len(self._futures) > self.cache_size:
+                oldest_key, oldest = next(iter(self._futures.items()))
+                if not oldest.done():
+                    break
+                del self._futures[oldest_key]
+        future.add_done_callback(lambda done: self._forget_failed(key, done))
+        return future
+
+    def _restart(self):
+        # Called with the lock held. Calls in flight on the broken pool have already failed.
+        broken, self._executor = self._executor, _start_executor(self.max_workers)
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._stats["restarts"] += 1
+        count("workers.restarts")
+
+    def _forget_failed(self, key, future):
+        if future.cancelled() or future.exception() is not None:
+            with self._lock:
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+
+    def stats(self):
+        with self._lock:
+            in_flight = sum(not future.done() for future in self._futures.values())
+            return {**self._stats, "workers": self.max_workers, "in_flight": in_flight}
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def start(max_workers=None):
+    """Start the process-wide pool; later calls return the running one.
+
+    Inside a worker process this does nothing and returns None, so a worker
+    that imports the app script never starts a pool of its own.
+    """
+    global _pool
+    if multiprocessing.current_process().name != "MainProcess":
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = WorkerPool(max_workers)
+        return _pool
+
+
+def stop():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def submit(fn, *args):
+    """Future for `fn(*args)`: from the pool when one is running, else computed here and already done."""
+    pool = _pool
+    if pool is not None:
+        return pool.submit(fn, *args)
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def result(future, fn, *args):
+    """`future.result()` for a future from `submit(fn, *args)`; computed here if its worker died."""
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        return fn(*args)
+
+
+def compute(fn, *args):
+    """`fn(*args)`, run on the shared pool when one is running."""
+    pool = _pool
+    return fn(*args) if pool is None else result(pool.submit(fn, *args), fn, *args)
+
+
+def stats():
+    """Request counters of the running pool, or None in single-process mode."""
+    pool = _pool
+    return None if pool is None else pool.stats()
@@ -0,0 +1,12 @@
+"""Shared fixtures. Run the suite from the repository root:
+    python -m pytest -q
+"""
+import pytest
+
+from tests.helpers import random_book as _random_book
+
+
+@pytest.fixture
+def random_book():
+    """Factory for random books; see `tests.helpers.random_book`."""
+    return _random_book
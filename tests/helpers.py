@@ -0,0 +1,99 @@
+"""Random books and reference pricers shared by the tests and the benchmarks.
+
+Nothing here imports pytest, so the benchmark scripts can use it too.
+"""
+import numpy as np
+from scipy.stats import norm
+
+from bsgreeks import norm_cdf, norm_pdf
+
+# Default (low, high) uniform ranges of the market columns
+COLUMNS = {"S": (50.0, 150.0), "K": (50.0, 150.0), "T": (0.05, 3.0), "r": (0.0, 0.1), "sigma": (0.1, 0.8)}
+
+
+def random_book(n, seed=0, **columns):
+    """A random book of n contracts: S, K, T, r, sigma arrays and an is_call mask.
+
+    A keyword overrides a column or adds one (q, quantity...). A (low, high)
+    tuple draws it uniformly, a scalar fills it, and an array is used as given.
+    """
+    rng = np.random.default_rng(seed)
+    book = {}
+    for name, spec in {**COLUMNS, **columns}.items():
+        if isinstance(spec, tuple):
+            book[name] = rng.uniform(*spec, n)
+        else:
+            book[name] = np.full(n, spec) if np.ndim(spec) == 0 else np.asarray(spec)
+    if "is_call" not in book:
+        book["is_call"] = rng.random(n) < 0.5
+    return book
+
+
+def expiry_day_book(n, expired_fraction, seed=0):
+    """T = 0 and zero-vol rows mixed with one-hour to two-day rows, plus a mask of the degenerate ones."""
+    rng = np.random.default_rng(seed)
+    T = rng.uniform(1 / (365 * 24), 2 / 365, n)
+    degenerate = rng.random(n) < expired_fraction
+    T[degenerate & (rng.random(n) < 0.5)] = 0.0
+    sigma = rng.uniform(0.1, 0.6, n)
+    sigma[degenerate & (T > 0)] = 0.0
+    S = rng.uniform(90, 110, n)
+    S[:5] = 100.0  # some rows exactly at the strike
+    return dict(S=S, K=100.0, T=T, r=0.05, sigma=sigma, is_call=rng.random(n) < 0.5), degenerate
+
+
+def option_chain(n, seed=0):
+    """A chain around S = 100: log-moneyness in [-0.5, 0.5], listed expiries from a week to two years."""
+    rng = np.random.default_rng(seed)
+    S = np.full(n, 100.0)
+    K = S * np.exp(rng.uniform(-0.5, 0.5, n))
+    T = rng.choice([7, 14, 30, 60, 90, 180, 365, 730], n) / 365.0
+    return dict(S=S, K=K, T=T, r=rng.uniform(0.0, 0.08, n), sigma=rng.uniform(0.05, 1.5, n),
+                is_call=rng.random(n) < 0.5)
+
+
+def legacy_black_scholes_greeks(S, K, T, r, sigma, option_type='call'):
+    """The app's scalar pricer exactly as it was before vectorization (scipy.stats, one branch per type)."""
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+    if option_type == 'call':
+        price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+        delta = norm.cdf(d1)
+        rho = K * T * np.exp(-r * T) * norm.cdf(d2)
+    else:
+        price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+        delta = norm.cdf(d1) - 1
+        rho = -K * T * np.exp(-r * T) * norm.cdf(-d2)
+    gamma = norm.pdf(d1) / (S * sigma * np.sqrt(T))
+    vega = S * norm.pdf(d1) * np.sqrt(T)
+    theta = (
+        - (S * norm.pdf(d1) * sigma) / (2 * np.sqrt(T))
+        - r * K * np.exp(-r * T) * norm.cdf(d2 if option_type == 'call' else -d2)
+    )
+    return price, delta, gamma, theta, vega, rho
+
+
+def plain_black_scholes_kernel(S, K, T, r, sigma, is_call=True):
+    """`black_scholes_greeks_batch` as it was before the carry parameter."""
+    S, K, T, r, sigma, is_call = np.broadcast_arrays(
+        np.asarray(S, dtype=float), np.asarray(K, dtype=float),
+        np.asarray(T, dtype=float), np.asarray(r, dtype=float),
+        np.asarray(sigma, dtype=float), np.asarray(is_call, dtype=bool),
+    )
+    w = np.where(is_call, 1.0, -1.0)
+    sqrt_T = np.sqrt(T)
+    sig_sqrt_T = sigma * sqrt_T
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    K_df = K * np.exp(-r * T)
+    N1 = norm_cdf(w * d1)
+    N2 = norm_cdf(w * d2)
+    n1 = norm_pdf(d1)
+    K_df_N2 = K_df * N2
+    return (w * (S * N1 - K_df_N2), w * N1, n1 / (S * sig_sqrt_T),
+            -(S * n1 * sigma) / (2 * sqrt_T) - w * r * K_df_N2, S * n1 * sqrt_T, w * T * K_df_N2)
+
+
+def max_relative_error(a, b):
+    """Largest |a - b| relative to |b|, floored at 1 so values near zero compare absolutely."""
+    return float(np.max(np.abs(np.asarray(a) - b) / np.maximum(1.0, np.abs(b))))
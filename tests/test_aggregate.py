@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from bsgreeks.aggregate import BookAggregation
+
+N, N_UNDERLYING = 60_000, 20
+
+
+@pytest.fixture
+def book(random_book):
+    rng = np.random.default_rng(3)
+    spots = rng.uniform(20, 500, N_UNDERLYING)
+    underlying = rng.integers(0, N_UNDERLYING, N).astype(np.int32)
+    S = spots[underlying]
+    book = random_book(N, S=S, K=S * rng.uniform(0.7, 1.3, N), T=(0.0, 3.0), r=0.03,
+                       quantity=rng.integers(-100, 101, N).astype(float), underlying=underlying)
+    book["underlying_labels"] = [f"U{i:03d}" for i in range(N_UNDERLYING)]
+    return book
+
+
+def assert_close(a, b):
+    assert np.max(np.abs(a - b) / np.maximum(np.abs(b), 1.0)) < 1e-9
+
+
+def test_netted_totals_match_brute_force(book):
+    agg = BookAggregation(book)
+    expiry = np.searchsorted(agg.expiry_edges, book["T"], side='left')
+    labels, values, counts = agg.netted("underlying", "expiry")
+    for (name, bucket), row, count in zip(labels, values, counts):
+        mask = (book["underlying"] == agg.labels["underlying"].index(name)) & \
+               (expiry == agg.labels["expiry"].index(bucket))
+        assert count == mask.sum()
+        assert_close(row, agg.contributions[:, mask].sum(axis=1))
+
+
+def test_partial_updates_match_a_fresh_aggregation(book):
+    rng = np.random.default_rng(1)
+    agg = BookAggregation(book)
+    for step in range(20):
+        if step % 2:
+            rows = agg.rows_of(f"U{rng.integers(N_UNDERLYING):03d}")
+            agg.update(rows, S=agg.columns["S"][rows] * rng.uniform(0.95, 1.05))
+        else:
+            rows = rng.random(N) < 0.02
+            agg.update(rows, T=np.maximum(agg.columns["T"][rows] - 30 / 365, 0.0))
+    fresh = BookAggregation({**agg.columns, "underlying": book["underlying"],
+                             "underlying_labels": book["underlying_labels"]})
+    assert np.array_equal(agg.counts, fresh.counts)
+    assert_close(agg.totals, fresh.totals)
+
+
+def test_level_order(book):
+    agg = BookAggregation(book)
+    labels, values, _ = agg.netted("underlying", "expiry")
+    by_key = dict(zip(labels, values))
+    for (bucket, name), row in zip(*agg.netted("expiry", "underlying")[:2]):
+        assert np.array_equal(row, by_key[(name, bucket)])
+
+
+def test_unknown_names_are_rejected(book):
+    agg = BookAggregation(book)
+    with pytest.raises(ValueError):
+        agg.netted("sector")
+    with pytest.raises(TypeError):
+        agg.update([0], spot=1.0)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from bsgreeks import american_greeks, black_scholes_greeks, black_scholes_greeks_batch
+from tests import helpers
+
+
+def test_call_without_carry_is_european():
+    call = american_greeks(100.0, 95.0, 1.0, 0.05, 0.25, True, tol=1e-5)
+    european = black_scholes_greeks(100.0, 95.0, 1.0, 0.05, 0.25, "call")
+    assert abs(call.greeks.price - european[0]) < 1e-4
+    for lattice, closed in zip(call.greeks, european):
+        assert lattice == pytest.approx(closed, abs=2e-2 * max(1.0, abs(closed)))
+
+
+def test_hull_american_put():
+    put = american_greeks(50.0, 50.0, 5 / 12, 0.1, 0.4, False, tol=1e-5).greeks.price
+    assert abs(put - 4.2842) < 1e-3
+
+
+def test_early_exercise_premium_is_never_negative(random_book):
+    book = random_book(200, seed=2, S=(60.0, 140.0), K=(60.0, 140.0), T=(0.05, 2.0), sigma=(0.1, 0.6))
+    result = american_greeks(**book)
+    assert result.converged.mean() > 0.95
+    premium = result.greeks.price - black_scholes_greeks_batch(**book).price
+    assert premium.min() > -1e-3
+
+
+def test_expired_and_zero_vol_contracts_skip_the_tree():
+    S, K = np.array([90.0, 110.0, 100.0, 100.0, 100.0]), 100.0
+    T = np.array([0.0, 0.0, 1.0, 1.0, 50.0])
+    sigma = np.array([0.2, 0.2, 0.0, 0.0, 0.0])
+    is_call = np.array([False, True, False, True, True])
+    result = american_greeks(S, K, T, 0.05, sigma, is_call, q=0.01)
+    assert result.converged.all() and (result.steps == 0).all()
+    # Expired: intrinsic value. Zero vol: the best of exercising now, at expiry, or in between
+    t = np.log(0.05 / 0.01) / 0.04
+    expected = [10.0, 10.0, 0.0, 100.0 * (np.exp(-0.01) - np.exp(-0.05)),
+                100.0 * (np.exp(-0.01 * t) - np.exp(-0.05 * t))]
+    np.testing.assert_allclose(result.greeks.price, expected, atol=1e-12)
+    assert result.greeks.delta[0] == -1.0 and result.greeks.delta[1] == 1.0
+    assert (result.greeks.gamma == 0.0).all() and (result.greeks.vega == 0.0).all()
+
+
+def test_too_few_steps_are_rejected():
+    with pytest.raises(ValueError, match="min_steps"):
+        american_greeks(100.0, 100.0, 1.0, 0.05, 0.2, min_steps=2, max_steps=2)
+
+
+@pytest.fixture(scope="module")
+def reference_book():
+    # Reference: one fine tree (no extrapolation), accurate to a few 1e-4 on this book
+    book = helpers.random_book(40, seed=3, S=(60.0, 140.0), K=(60.0, 140.0), T=(0.05, 2.0), sigma=(0.1, 0.6))
+    return book, american_greeks(**book, tol=0.0, min_steps=3200, max_steps=3200).greeks.price
+
+
+@pytest.mark.parametrize("tol", [1e-2, 1e-3])
+def test_converged_contracts_are_within_tol(reference_book, tol):
+    book, reference = reference_book
+    result = american_greeks(**book, tol=tol)
+    assert result.converged.mean() > 0.9
+    error = np.abs(result.greeks.price - reference)[result.converged]
+    assert error.max() <= tol
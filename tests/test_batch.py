@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from bsgreeks import black_scholes_greeks, black_scholes_greeks_batch
+from tests.helpers import legacy_black_scholes_greeks, max_relative_error
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_batch_matches_the_legacy_scalar_pricer(random_book, option_type):
+    book = random_book(500, is_call=option_type == "call")
+    batch = black_scholes_greeks_batch(**book)
+    # The legacy put theta subtracted r K e^{-rT} N(-d2) instead of adding it; see test_put_theta
+    fields = [name for name in batch._fields if not (option_type == "put" and name == "theta")]
+    for i in range(500):
+        row = [book[name][i] for name in ("S", "K", "T", "r", "sigma")]
+        expected = dict(zip(batch._fields, legacy_black_scholes_greeks(*row, option_type)))
+        assert max_relative_error([getattr(batch, name)[i] for name in fields],
+                                  [expected[name] for name in fields]) < 1e-12, i
+
+
+def test_put_theta(random_book):
+    # Put-call parity: theta_put = theta_call + r K e^{-rT}
+    book = random_book(10_000)
+    calls = black_scholes_greeks_batch(**{**book, "is_call": True})
+    puts = black_scholes_greeks_batch(**{**book, "is_call": False})
+    parity = calls.theta + book["r"] * book["K"] * np.exp(-book["r"] * book["T"])
+    assert max_relative_error(puts.theta, parity) < 1e-12
+
+
+def test_interactive_tool_curve():
+    S_range = np.linspace(50, 150, 1000)
+    curve = black_scholes_greeks_batch(S_range, 105.0, 1.0, 0.05, 0.2, True).delta
+    legacy = [legacy_black_scholes_greeks(s, 105.0, 1.0, 0.05, 0.2, 'call')[1] for s in S_range]
+    assert np.allclose(curve, legacy, rtol=1e-12, atol=0)
+
+
+def test_scalar_wrapper_returns_a_tuple_of_scalars():
+    greeks = black_scholes_greeks(100.0, 105.0, 1.0, 0.05, 0.2, 'put')
+    assert isinstance(greeks, tuple) and len(greeks) == 6
+    assert all(np.ndim(value) == 0 for value in greeks)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from bsgreeks import black76_greeks, black_scholes_greeks_batch, garman_kohlhagen_greeks, norm_cdf
+from tests.helpers import plain_black_scholes_kernel
+
+
+@pytest.fixture
+def book(random_book):
+    return random_book(100_000, S=(60.0, 140.0), K=(60.0, 140.0))
+
+
+@pytest.fixture
+def q(book):
+    return np.random.default_rng(1).uniform(0.0, 0.08, len(book["S"]))
+
+
+def test_zero_carry_is_plain_black_scholes_bit_for_bit(book):
+    for reference, values in zip(plain_black_scholes_kernel(**book), black_scholes_greeks_batch(**book)):
+        assert np.array_equal(reference, values)
+
+
+def test_put_call_parity(book, q):
+    calls = black_scholes_greeks_batch(**{**book, "is_call": True}, q=q)
+    puts = black_scholes_greeks_batch(**{**book, "is_call": False}, q=q)
+    forward = book["S"] * np.exp(-q * book["T"]) - book["K"] * np.exp(-book["r"] * book["T"])
+    assert np.max(np.abs(calls.price - puts.price - forward)) < 1e-10
+
+
+@pytest.mark.parametrize("name, bumped, h, sign", [("delta", "S", 1e-4, 1.0), ("theta", "T", 1e-6, -1.0),
+                                                    ("rho", "r", 1e-6, 1.0)])
+def test_greeks_match_finite_difference(book, q, name, bumped, h, sign):
+    greeks = black_scholes_greeks_batch(**book, q=q)
+    up = black_scholes_greeks_batch(**{**book, bumped: book[bumped] + h}, q=q).price
+    down = black_scholes_greeks_batch(**{**book, bumped: book[bumped] - h}, q=q).price
+    assert np.max(np.abs(getattr(greeks, name) - sign * (up - down) / (2 * h))) < 1e-4
+
+
+def test_black76(book):
+    F, K, T, r, sigma, is_call = (book[name] for name in ("S", "K", "T", "r", "sigma", "is_call"))
+    w = np.where(is_call, 1.0, -1.0)
+    d1 = (np.log(F / K) + 0.5 * sigma**2 * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+    textbook = np.exp(-r * T) * w * (F * norm_cdf(w * d1) - K * norm_cdf(w * d2))
+    b76 = black76_greeks(F, K, T, r, sigma, is_call)
+    rho_fd = (black76_greeks(F, K, T, r + 1e-6, sigma, is_call).price
+              - black76_greeks(F, K, T, r - 1e-6, sigma, is_call).price) / 2e-6
+    assert np.max(np.abs(b76.price - textbook)) < 1e-10
+    assert np.max(np.abs(b76.rho - rho_fd)) < 1e-4
+
+
+def test_garman_kohlhagen_is_the_foreign_rate_as_carry(book, q):
+    S, K, T, r, sigma, is_call = (book[name] for name in ("S", "K", "T", "r", "sigma", "is_call"))
+    gk = garman_kohlhagen_greeks(S, K, T, r, q, sigma, is_call)
+    assert np.array_equal(gk.price, black_scholes_greeks_batch(S, K, T, r, sigma, is_call, q=q).price)
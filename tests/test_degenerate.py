@@ -0,0 +1,44 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from bsgreeks import black_scholes_greeks_batch, black_scholes_greeks_extended
+from tests.helpers import expiry_day_book
+
+
+def limits(S, K, T, r, sigma, is_call, q):
+    # Deterministic forward: the option is worth its discounted intrinsic value
+    w = np.where(is_call, 1.0, -1.0)
+    S_df, K_df = S * np.exp(-q * T), K * np.exp(-r * T)
+    step = np.where(np.isclose(S_df, K_df, rtol=0, atol=1e-12), 0.5, (w * (S_df - K_df) > 0).astype(float))
+    return dict(price=np.maximum(w * (S_df - K_df), 0.0), delta=w * np.exp(-q * T) * step,
+                theta=w * (q * S_df - r * K_df) * step, rho=w * T * K_df * step)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("q", [0.0, 0.02])
+def test_expiry_day_book_prices_at_its_limits(q, dtype):
+    n = 100_000
+    book, degenerate = expiry_day_book(n, 0.5)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        greeks = black_scholes_greeks_batch(**book, q=q, dtype=dtype)
+        extended = black_scholes_greeks_extended(**book, q=q, dtype=dtype)
+    assert all(np.isfinite(values).all() for values in (*greeks, *extended.values()))
+
+    rows = {key: np.broadcast_to(value, (n,))[degenerate] for key, value in book.items()}
+    expected = limits(**rows, q=q)
+    atol = 1e-4 if dtype == np.float32 else 1e-10
+    for name, value in expected.items():
+        assert np.allclose(getattr(greeks, name)[degenerate], value, rtol=0, atol=atol), name
+    for name in ("gamma", "vega", "vanna", "volga", "speed", "color", "zomma"):
+        assert not np.any(extended[name][degenerate]), name
+    assert np.allclose(extended["charm"][degenerate], q * expected["delta"], atol=atol)
+
+
+def test_limits_are_continuous():
+    S, is_call = np.array([95.0, 105.0]), [False, True]
+    near = black_scholes_greeks_batch(S, 100.0, 1e-20, 0.05, 0.2, is_call)
+    at = black_scholes_greeks_batch(S, 100.0, 0.0, 0.05, 0.2, is_call)
+    assert all(np.allclose(a, b, atol=1e-9) for a, b in zip(near, at))
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from bsgreeks import black_scholes_greeks_batch, black_scholes_greeks_extended
+
+# Greek -> (first-order Greek it differentiates, input bumped, sign for -d/dT)
+FD_CHECKS = {
+    "vanna": ("delta", "sigma", 1.0),
+    "volga": ("vega", "sigma", 1.0),
+    "charm": ("delta", "T", -1.0),
+    "speed": ("gamma", "S", 1.0),
+    "color": ("gamma", "T", -1.0),
+    "zomma": ("gamma", "sigma", 1.0),
+}
+BUMP = {"S": 1e-3, "sigma": 1e-5, "T": 1e-6}
+
+
+@pytest.fixture(params=[0.0, (0.0, 0.08)], ids=["q=0", "q>0"])
+def book(request, random_book):
+    return random_book(10_000, S=(60.0, 140.0), K=(60.0, 140.0), T=(0.1, 3.0), q=request.param)
+
+
+@pytest.mark.parametrize("name", FD_CHECKS)
+def test_matches_finite_difference(book, name):
+    base, bumped, sign = FD_CHECKS[name]
+    h = BUMP[bumped]
+    up = black_scholes_greeks_batch(**{**book, bumped: book[bumped] + h})
+    down = black_scholes_greeks_batch(**{**book, bumped: book[bumped] - h})
+    fd = sign * (getattr(up, base) - getattr(down, base)) / (2 * h)
+    scale = np.maximum(np.abs(fd), 1e-3 * np.max(np.abs(fd)))
+    extended = black_scholes_greeks_extended(**book, greeks=[name])
+    assert np.max(np.abs(extended[name] - fd) / scale) < 1e-4
+
+
+def test_first_order_match_the_batch_pricer(book):
+    extended = black_scholes_greeks_extended(**book)
+    batch = black_scholes_greeks_batch(**book)
+    for name in batch._fields:
+        assert np.allclose(extended[name], getattr(batch, name), rtol=1e-14, atol=0), name
+
+
+def test_subset_and_alias():
+    extended = black_scholes_greeks_extended(100.0, 105.0, 1.0, 0.05, 0.2, greeks=("vomma", "delta"))
+    assert list(extended) == ["volga", "delta"]
+    with pytest.raises(ValueError, match="Unknown Greek"):
+        black_scholes_greeks_extended(100.0, 105.0, 1.0, 0.05, 0.2, greeks=("veta",))
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from bsgreeks import black_scholes_greeks_batch
+from bsgreeks.fused import fused_greeks, jit_available
+
+ROOT = Path(__file__).resolve().parents[1]
+FALLBACK_PROBE = """
+import numpy as np
+from bsgreeks import black_scholes_greeks_batch
+from bsgreeks.fused import fused_greeks, jit_available
+args = (np.linspace(50, 150, 101), 100.0, 0.5, 0.03, 0.25, True, 0.01)
+assert not jit_available()
+assert all(np.array_equal(a, b) for a, b in zip(fused_greeks(*args), black_scholes_greeks_batch(*args)))
+"""
+
+needs_numba = pytest.mark.skipif(not jit_available(), reason="numba is not installed")
+
+
+def assert_parity(inputs, tol=1e-12):
+    fused, numpy = fused_greeks(**inputs), black_scholes_greeks_batch(**inputs)
+    for name, a, b in zip(numpy._fields, fused, numpy):
+        assert np.shape(a) == np.shape(b) and type(a) is type(b), (name, np.shape(a), type(a))
+        assert np.max(np.abs(a - b) / np.maximum(1.0, np.abs(b))) < tol, name
+
+
+@pytest.fixture
+def book(random_book):
+    return random_book(100_000, T=(0.0, 3.0), sigma=(0.05, 1.0))
+
+
+@needs_numba
+def test_random_book(book):
+    assert_parity(book)
+    assert_parity({**book, "q": np.random.default_rng(1).uniform(0.0, 0.08, 100_000)})
+
+
+@needs_numba
+def test_degenerate_and_deep_rows():
+    S = np.array([100.0, 100.0, 100.0, 90.0, 110.0, 100.0, 1.0, 10_000.0])
+    assert_parity(dict(S=S, K=100.0, T=np.array([0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0]), r=0.05,
+                       sigma=np.array([0.2, 0.2, 0.0, 0.2, 0.2, 0.0, 0.2, 0.2]),
+                       is_call=np.array([True, False, True, True, False, False, True, False]), q=0.02))
+
+
+@needs_numba
+def test_broadcasting():
+    assert_parity(dict(S=100.0, K=105.0, T=1.0, r=0.05, sigma=0.2, is_call=False))
+    assert_parity(dict(S=np.linspace(50, 150, 1000), K=105.0, T=1.0, r=0.05, sigma=0.2))
+    x, y = np.linspace(50, 150, 40), np.linspace(0.1, 5.0, 30)
+    assert_parity(dict(S=x[None, :], K=100.0, T=y[:, None], r=0.05, sigma=0.3, is_call=True))
+
+
+@needs_numba
+def test_float32_is_float64_rounded_once(book):
+    single = fused_greeks(**book, dtype=np.float32)
+    # The float64 result for the same float32-rounded inputs
+    rounded = {name: values.astype(np.float32) if values.dtype == float else values for name, values in book.items()}
+    reference = black_scholes_greeks_batch(**rounded)
+    for name, a, b in zip(reference._fields, single, reference):
+        assert a.dtype == np.float32, name
+        bound = np.spacing(np.abs(b).astype(np.float32)) + 1e-12 * np.maximum(1.0, np.abs(b))
+        assert np.all(np.abs(a - b) <= bound), name
+
+
+def test_jit_disabled_falls_back_to_the_batch_pricer():
+    env = {**os.environ, "BSGREEKS_JIT": "0"}
+    subprocess.run([sys.executable, "-c", FALLBACK_PROBE], cwd=ROOT, env=env, check=True)
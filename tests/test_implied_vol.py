@@ -0,0 +1,38 @@
+import numpy as np
+
+from bsgreeks import black_scholes_greeks_batch, implied_volatility
+from bsgreeks.implied_vol import SIGMA_MAX, SIGMA_MIN
+from tests.helpers import option_chain
+
+
+def test_recovers_sigma_across_a_chain():
+    chain = option_chain(100_000)
+    sigma = chain.pop("sigma")
+    greeks = black_scholes_greeks_batch(**chain, sigma=sigma)
+    result = implied_volatility(greeks.price, **chain)
+
+    assert result.converged.all()
+    assert not np.isnan(result.sigma).any()
+    # Far-OTM short-dated rows carry no information about sigma below the price tolerance
+    identifiable = greeks.vega > 1e-6
+    assert identifiable.mean() > 0.9
+    # A price tolerance of 1e-10 pins sigma to about 1e-10 / vega
+    error = np.abs(result.sigma - sigma)[identifiable]
+    assert np.all(error <= 10 * 1e-10 / greeks.vega[identifiable])
+    assert np.max(error[greeks.vega[identifiable] > 1e-2]) < 1e-8
+    # Whatever sigma comes back reproduces the price, up to rounding in the put-call conversion
+    repriced = black_scholes_greeks_batch(**chain, sigma=result.sigma).price
+    assert np.max(np.abs(repriced - greeks.price)) <= 1e-10 + 1e-12
+
+
+def test_prices_at_the_bounds():
+    S, K, T, r = 100.0, np.array([80.0, 120.0, 100.0, 100.0]), 0.5, 0.03
+    K_df = K * np.exp(-r * T)
+    call = np.array([S - K_df[0], 0.0, S, S + 1.0])
+    result = implied_volatility(call, S, K, T, r, True)
+    np.testing.assert_array_equal(result.sigma[:3], [SIGMA_MIN, SIGMA_MIN, SIGMA_MAX])
+    np.testing.assert_array_equal(result.iterations[:3], 0)
+    assert np.isnan(result.sigma[3]) and not result.converged[3]
+    # A put quoted at intrinsic converts to a call price that rounds to either side of the bound
+    put = implied_volatility(K_df[1] - S, S, K[1], T, r, False)
+    assert put.sigma == SIGMA_MIN and put.converged
@@ -0,0 +1,27 @@
+import numpy as np
+
+from bsgreeks import black_scholes_greeks_batch
+from bsgreeks.incremental import IncrementalPricer
+from tests.helpers import max_relative_error
+
+
+def test_random_updates_match_the_batch_pricer(random_book):
+    n, rng = 10_000, np.random.default_rng(1)
+    book = random_book(n, S=(50.0, 150.0), T=(0.0, 2.0), r=0.03, q=0.01)
+    book["T"][: n // 100] = 0.0
+    pricer = IncrementalPricer(**book)
+    for _ in range(50):
+        name = rng.choice(["S", "K", "T", "r", "sigma", "is_call", "q"])
+        book[name] = np.logical_not(book[name]) if name == "is_call" else book[name] * rng.uniform(0.9, 1.1)
+        greeks = pricer.update(**{name: book[name]}).greeks()
+        reference = black_scholes_greeks_batch(**book)
+        for values, expected in zip(greeks, reference):
+            assert max_relative_error(values, expected) < 1e-12, name
+
+
+def test_unchanged_value_recomputes_nothing(random_book):
+    book = random_book(1_000)
+    pricer = IncrementalPricer(**book)
+    pricer.greeks()
+    pricer.update(sigma=book["sigma"].copy()).greeks()
+    assert pricer.recomputed == []
@@ -0,0 +1,49 @@
+import urllib.request
+
+import pytest
+
+from bsgreeks import metrics
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    was_enabled = metrics.is_enabled()
+    metrics.reset()
+    yield
+    metrics.enable(was_enabled)
+    metrics.reset()
+
+
+def test_disabled_hooks_record_nothing():
+    metrics.enable(False)
+    with metrics.stage("check.stage"):
+        metrics.count("check.count")
+    assert metrics.snapshot() == {"stages": {}, "counters": {}}
+
+
+def test_enabled_stage_and_prometheus_export():
+    metrics.enable(True)
+    for _ in range(3):
+        with metrics.stage("check.stage"):
+            metrics.count("check.count")
+    snapshot = metrics.snapshot()
+    assert snapshot["stages"]["check.stage"]["count"] == 3 and snapshot["counters"]["check.count"] == 3
+
+    text = metrics.prometheus_text()
+    buckets = [int(line.rsplit(" ", 1)[1]) for line in text.splitlines()
+               if line.startswith("bsgreeks_check_stage_seconds_bucket")]
+    assert buckets == sorted(buckets) and buckets[-1] == 3
+    assert "bsgreeks_check_count_total 3" in text
+
+    server = metrics.serve(port=0)
+    with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+        assert response.read().decode() == metrics.prometheus_text()
+
+
+def test_latency_histogram_percentiles():
+    histogram = metrics.LatencyHistogram()
+    for seconds in [1e-4] * 90 + [1e-2] * 10:
+        histogram.record(seconds)
+    assert histogram.total == 100 and histogram.sum == pytest.approx(0.109)
+    assert histogram.percentile(50) == pytest.approx(1e-4, rel=0.13)
+    assert histogram.percentile(99) == pytest.approx(1e-2, rel=0.13)
@@ -0,0 +1,34 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from bsgreeks import black_scholes_greeks, monte_carlo_price
+
+CONTRACT = dict(S=100.0, K=105.0, T=1.0, r=0.05, sigma=0.2)
+N_PATHS = 2_000_000
+
+
+def asian_call(paths, K):
+    return np.maximum(paths.mean(axis=1) - K, 0.0)
+
+
+@pytest.mark.parametrize("antithetic", [False, True])
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_european_within_four_standard_errors(option_type, antithetic):
+    closed = black_scholes_greeks(**CONTRACT, option_type=option_type)[0]
+    mc = monte_carlo_price(**CONTRACT, is_call=option_type == "call", n_paths=N_PATHS, antithetic=antithetic)
+    assert abs(mc.price - closed) < 4 * mc.std_error
+
+
+def test_same_seed_in_process_and_across_a_pool():
+    serial = monte_carlo_price(**CONTRACT, n_paths=N_PATHS, chunk_size=250_000, max_workers=1)
+    pooled = monte_carlo_price(**CONTRACT, n_paths=N_PATHS, chunk_size=250_000, max_workers=4)
+    assert serial.price == pooled.price
+
+
+def test_control_variate_agrees_with_plain_monte_carlo():
+    asian = partial(asian_call, K=CONTRACT["K"])
+    controlled = monte_carlo_price(**CONTRACT, n_paths=N_PATHS // 10, n_steps=12, payoff=asian)
+    combined_error = np.hypot(controlled.std_error, controlled.plain_std_error)
+    assert abs(controlled.price - controlled.plain_price) < 4 * combined_error
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from bsgreeks import norm_cdf, norm_pdf
+
+TOLERANCE = 1e-15
+
+
+def test_arrays_match_scipy():
+    x = np.concatenate([np.linspace(-40, 40, 200_001), np.random.default_rng(0).standard_normal(1_000_000)])
+    assert np.max(np.abs(norm_cdf(x) - norm.cdf(x))) <= TOLERANCE
+    assert np.max(np.abs(norm_pdf(x) - norm.pdf(x))) <= TOLERANCE
+
+
+@pytest.mark.parametrize("x", [-8.5, -1.0, 0.0, 0.3253, 7.9])
+def test_scalars_match_scipy(x):
+    assert abs(norm_cdf(x) - norm.cdf(x)) <= TOLERANCE
+    assert abs(norm_pdf(x) - norm.pdf(x)) <= TOLERANCE
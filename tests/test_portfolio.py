@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from bsgreeks.portfolio import read_positions
+
+HEADER = "S,K,T,r,sigma,type,quantity\n"
+
+
+def test_types_are_trimmed_and_case_insensitive(tmp_path):
+    path = tmp_path / "book.csv"
+    path.write_text(HEADER + "100,100,1,0.05,0.2, Call ,1\n100,100,1,0.05,0.2,PUT,2\n")
+    np.testing.assert_array_equal(read_positions(path)["is_call"], [True, False])
+
+
+def test_unknown_types_are_rejected_with_their_rows(tmp_path):
+    path = tmp_path / "book.csv"
+    path.write_text(HEADER + "100,100,1,0.05,0.2,call,1\n100,100,1,0.05,0.2,cal,1\n"
+                    "100,100,1,0.05,0.2,put,1\n100,100,1,0.05,0.2,straddle,1\n")
+    with pytest.raises(ValueError, match=r"2 \('cal'\), 4 \('straddle'\)"):
+        read_positions(path)
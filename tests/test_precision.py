@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from bsgreeks import black_scholes_greeks_batch, black_scholes_greeks_extended
+from tests.helpers import random_book
+
+# The bounds quoted in the black_scholes_greeks_batch docstring: relative to S for price, theta, vega
+# and rho, absolute for delta, relative for gamma
+TOLERANCES = dict(price=1e-6, delta=5e-6, gamma=1e-4, theta=1e-6, vega=1e-6, rho=3e-6)
+# Gammas far out of the money underflow in float32; below this they are compared absolutely
+GAMMA_FLOOR = 1e-8
+
+
+@pytest.fixture(scope="module")
+def book():
+    # One million rows, built once for the module, so the shared function-scoped fixture is not used
+    return random_book(1_000_000, T=(0.02, 3.0), sigma=(0.05, 1.0))
+
+
+def test_float32_stays_float32(book):
+    single = black_scholes_greeks_batch(**book, dtype=np.float32)
+    extended = black_scholes_greeks_extended(**book, dtype=np.float32)
+    assert all(values.dtype == np.float32 for values in (*single, *extended.values()))
+
+
+def test_float32_error_against_float64(book):
+    single = black_scholes_greeks_batch(**book, dtype=np.float32)
+    double = black_scholes_greeks_batch(**book)
+    S = book["S"]
+    scales = dict(price=S, delta=1.0, gamma=np.maximum(np.abs(double.gamma), GAMMA_FLOOR), theta=S, vega=S, rho=S)
+    for name in double._fields:
+        error = np.abs(getattr(single, name) - getattr(double, name))
+        assert np.max(error / scales[name]) < TOLERANCES[name], name
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from bsgreeks import black_scholes_greeks_batch, stress_cube
+
+
+def test_shocks_past_expiry_and_zero_vol_take_the_limits():
+    positions = {"S": np.array([100.0, 100.0]), "K": np.array([95.0, 110.0]), "T": np.array([0.05, 0.05]),
+                 "r": np.array([0.03, 0.03]), "sigma": np.array([0.2, 0.2]), "is_call": np.array([True, False]),
+                 "quantity": np.array([1.0, 2.0])}
+    cube = stress_cube(positions, spot_shocks=[-0.1, 0.0, 0.1], vol_shocks=[-0.3, 0.0], time_steps=[0.0, 0.1])
+    assert all(np.isfinite(values).all() for values in cube.values.values())
+
+    # Decayed past expiry: worth intrinsic value, whatever the vol shock
+    S = 100.0 * np.array([0.9, 1.0, 1.1])
+    intrinsic = np.maximum(S - 95.0, 0.0) + 2.0 * np.maximum(110.0 - S, 0.0)
+    for vol in range(2):
+        np.testing.assert_allclose(cube.values["price"][:, vol, 0, 1], intrinsic, atol=1e-12)
+
+    # Vol shocked below zero: priced as the deterministic forward, same as sigma = 0
+    expected = black_scholes_greeks_batch(S[:, None], positions["K"], 0.05, 0.03, 0.0, positions["is_call"])
+    np.testing.assert_allclose(cube.values["price"][:, 0, 0, 0], expected.price @ positions["quantity"])
+
+
+@pytest.mark.parametrize("max_elements", [7, 50, 997])
+def test_chunked_cube_matches_a_single_pass(random_book, max_elements):
+    # 7 is smaller than the 48-scenario grid, so the scenarios are split as well as the positions
+    positions = random_book(101, T=(0.0, 1.0), quantity=np.arange(101) % 11 - 5.0)
+    shocks = dict(spot_shocks=[-0.2, 0.0, 0.2], vol_shocks=[-0.1, 0.0, 0.1, 0.3], rate_shifts=[0.0, 0.01],
+                  time_steps=[0.0, 0.5])
+    whole = stress_cube(positions, **shocks, max_elements=10**9)
+    chunked = stress_cube(positions, **shocks, max_elements=max_elements)
+    for name, values in whole.values.items():
+        np.testing.assert_allclose(chunked.values[name], values, rtol=1e-12, atol=1e-9, err_msg=name)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from bsgreeks import black_scholes_greeks_batch
+from bsgreeks.portfolio import revalue
+from bsgreeks.store import PositionStore, csv_to_store, store_to_csv, write_store
+
+N = 100_003  # not a multiple of 8, so the last byte of packed flags is partial
+
+
+@pytest.fixture
+def positions(random_book):
+    return random_book(N, T=(0.0, 3.0), r=0.03, quantity=np.arange(N) % 201 - 100.0)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_csv_round_trip_is_exact(tmp_path, positions, dtype):
+    store = write_store(tmp_path / "book.positions", positions, dtype)
+    store_to_csv(store, tmp_path / "round_trip.csv")
+    again = csv_to_store(tmp_path / "round_trip.csv", tmp_path / "again.positions", dtype)
+    assert len(again) == N and again.dtype == dtype
+    for name in ("S", "K", "T", "r", "sigma", "is_call", "quantity"):
+        assert np.array_equal(store[name], again[name]), name
+
+
+def test_unaligned_chunks(tmp_path, positions):
+    write_store(tmp_path / "book.positions", positions)
+    store = PositionStore.open(tmp_path / "book.positions")
+    for start, stop in ((0, 1), (3, 1003), (7, 9), (N - 5, N), (8, 16)):
+        chunk = store.chunk(start, stop)
+        assert np.array_equal(chunk["is_call"], positions["is_call"][start:stop]), (start, stop)
+        assert np.array_equal(chunk["S"], positions["S"][start:stop])
+
+
+def test_market_chunk_goes_straight_to_the_pricer(tmp_path, positions):
+    store = write_store(tmp_path / "book.positions", positions)
+    from_store = black_scholes_greeks_batch(**store.market_chunk(100, 1100))
+    columns = ("S", "K", "T", "r", "sigma", "is_call")
+    in_memory = black_scholes_greeks_batch(**{name: positions[name][100:1100] for name in columns})
+    for name in from_store._fields:
+        assert np.array_equal(getattr(from_store, name), getattr(in_memory, name)), name
+
+
+def test_revalue_from_store_matches_in_memory(tmp_path, positions):
+    store = write_store(tmp_path / "book.positions", positions)
+    from_store = revalue(store, chunk_size=7_777, max_workers=2)
+    in_memory = revalue(positions, chunk_size=7_777, max_workers=2)
+    assert np.allclose(from_store, in_memory, rtol=1e-12, atol=1e-9)
+
+
+def test_underlying_codes_round_trip(tmp_path, positions):
+    positions = {**positions, "underlying": np.arange(N, dtype=np.int32) % 3, "underlying_labels": ["AAA", "BBB", "CCC"]}
+    store_to_csv(write_store(tmp_path / "book.positions", positions), tmp_path / "book.csv")
+    again = csv_to_store(tmp_path / "book.csv", tmp_path / "again.positions")
+    assert again["underlying_labels"] == ["AAA", "BBB", "CCC"]
+    assert np.array_equal(again["underlying"], positions["underlying"])
@@ -0,0 +1,57 @@
+import asyncio
+import warnings
+
+import numpy as np
+import pytest
+
+from bsgreeks import black_scholes_greeks_batch
+from bsgreeks.streaming import PrecomputedBook, stream_greeks, tick_greeks
+from tests.helpers import expiry_day_book
+
+
+def book_totals(book, S):
+    columns = {key: value for key, value in book.items() if key != "quantity"}
+    greeks = black_scholes_greeks_batch(S=S, **columns)
+    return np.array([book["quantity"] @ values for values in greeks])
+
+
+def assert_matches_batch(book, spots):
+    precomputed = PrecomputedBook(**book)
+    for tick in tick_greeks(precomputed, spots):
+        expected = book_totals(book, tick.spot)
+        np.testing.assert_allclose(tick.greeks, expected, rtol=1e-10, atol=1e-8 * np.abs(expected).max())
+
+
+@pytest.mark.parametrize("q", [0.0, 0.02])
+def test_matches_the_batch_pricer(random_book, q):
+    book = random_book(10_000, r=0.03, q=q, quantity=np.arange(10_000) % 100 - 50.0)
+    del book["S"]
+    assert_matches_batch(book, [80.0, 100.0, 125.0])
+
+
+@pytest.mark.parametrize("q", [0.0, 0.02])
+def test_degenerate_rows_take_their_limits(q):
+    book, degenerate = expiry_day_book(10_000, 0.5)
+    del book["S"]
+    book = {key: np.broadcast_to(value, (10_000,)) for key, value in book.items()}
+    book.update(q=q, quantity=np.linspace(-5.0, 5.0, 10_000))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        # 100 is exactly at the strike for the T = 0 rows
+        assert_matches_batch(book, [95.0, 100.0, 105.0])
+
+
+def test_source_errors_reach_the_consumer():
+    async def failing_source():
+        yield 100.0
+        yield 101.0
+        raise ConnectionResetError("feed dropped")
+
+    async def consume():
+        spots = []
+        async for tick in stream_greeks(PrecomputedBook(100.0, 1.0, 0.05, 0.2), failing_source(), conflate=False):
+            spots.append(tick.spot)
+        return spots
+
+    with pytest.raises(ConnectionResetError, match="feed dropped"):
+        asyncio.run(asyncio.wait_for(consume(), timeout=5))
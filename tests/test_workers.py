@@ -0,0 +1,72 @@
+import math
+import os
+import signal
+import sys
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from bsgreeks import workers
+from bsgreeks.render import greek_chart
+
+CHART = ("Gamma", 100.0, 105.0, 1.0, 0.05, 0.2, 'put', 1000)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = workers.WorkerPool(2)
+    yield pool
+    pool.shutdown()
+
+
+def test_in_flight_requests_are_merged_and_results_cached(pool):
+    first, second = pool.submit(time.sleep, 0.3), pool.submit(time.sleep, 0.3)
+    assert first is second and pool.stats()["coalesced"] == 1
+    first.result()
+    assert pool.submit(time.sleep, 0.3) is first and pool.stats()["cached"] == 1
+
+
+def test_failures_raise_in_the_caller_and_are_not_cached(pool):
+    submitted = pool.stats()["submitted"]
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            pool.submit(math.sqrt, -1.0).result()
+    time.sleep(0.05)  # the done callback that forgets the failure runs in the pool's result thread
+    assert pool.stats()["submitted"] == submitted + 2
+
+
+def test_worker_charts_are_identical(pool):
+    assert pool.submit(greek_chart, *CHART).result() == greek_chart(*CHART)
+
+
+def test_without_a_pool_compute_runs_here():
+    assert workers.stats() is None
+    assert workers.compute(greek_chart, *CHART) == greek_chart(*CHART)
+    assert workers.submit(math.sqrt, 4.0).result() == 2.0
+
+
+def test_a_dead_worker_is_replaced():
+    pool = workers.WorkerPool(1)
+    try:
+        pid = pool.submit(os.getpid).result()
+        running = pool.submit(time.sleep, 0.5)
+        os.kill(pid, signal.SIGKILL)
+        # The call that was running when the worker died is computed here instead
+        assert workers.result(running, time.sleep, 0.0) is None
+        assert isinstance(running.exception(), BrokenProcessPool)
+        # The next request goes to a fresh pool
+        assert pool.submit(math.sqrt, 9.0).result() == 3.0
+        assert pool.stats()["restarts"] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_workers_do_not_start_nested_pools():
+    main = sys.modules["__main__"]
+    pool = workers.WorkerPool(1)
+    try:
+        assert sys.modules["__main__"] is main
+        assert pool.submit(workers.start, 2).result() is None
+    finally:
+        pool.shutdown()